@@ -3,25 +3,215 @@ AI Metadata Generator for YouTube Videos.
 Uses Google Generative AI (gemini-2.5-flash) to generate optimized titles and descriptions.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Dict, Optional
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import google.generativeai as genai
+import numpy as np
+from google.api_core.exceptions import ResourceExhausted
 
 import config
 
-# Configure logging
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+_PROMPT_TEMPLATE = """You are a YouTube SEO expert. Generate an optimized title and description for a YouTube video based on the following information:
+
+Video Content: {video_context}
+Language: {video_language}
+Category: {category}
+Existing Tags: {tags}
+
+Requirements:
+1. Title (max 100 characters):
+   - Create a catchy, attention-grabbing title
+   - Include relevant keywords for SEO
+   - Use power words to increase click-through rate
+   - Make it compelling and click-worthy
+   - Avoid clickbait - be authentic
+
+2. Description (500-1000 characters):
+   - Start with a strong hook to engage viewers
+   - Include relevant keywords naturally
+   - Provide value and set expectations
+   - Include a call-to-action
+   - Add relevant hashtags (3-5)
+   - Format with paragraphs for readability
+   - Mention key topics covered
+
+3. Generate 5-7 additional relevant tags (comma-separated)
+
+Format your response exactly like this:
+
+TITLE: [Your title here]
+
+DESCRIPTION: [Your description here]
+
+TAGS: [tag1, tag2, tag3, tag4, tag5]"""
+
+# Matches the TITLE / DESCRIPTION / TAGS layout requested in the prompt
+_RESPONSE_RE = re.compile(
+    r'TITLE:\s*(.*?)(?:\n\n+DESCRIPTION:\s*(.*?))?(?:\n\n+TAGS:\s*(.*?))?\s*\Z',
+    re.DOTALL
+)
+
+
+class _ResponseCache:
+    """
+    Two-tier cache for generated metadata.
+
+    Exact prompt matches are served from an in-memory LRU persisted to SQLite.
+    Near-duplicate video contexts are matched by embedding cosine similarity,
+    scoped to the same language, category and tags.
+    """
+
+    def __init__(self, db_path, max_entries: int, threshold: float):
+        """
+        Initialize the cache and load persisted entries.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_entries: Maximum number of entries kept per tier
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        # scope -> (results, L2-normalized float32 embeddings of shape (N, D))
+        self._semantic: Dict[str, Tuple[List[Dict[str, str]], np.ndarray]] = {}
+
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, scope TEXT NOT NULL, "
+            "result TEXT NOT NULL, embedding BLOB)"
+        )
+        self._db.commit()
+        self._load()
+
+    @staticmethod
+    def make_key(prompt: str) -> str:
+        """Return the exact-match key for a prompt."""
+        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_scope(video_language: str, category: str, tags: str) -> str:
+        """Return the semantic scope for the non-context prompt fields."""
+        return hashlib.sha256(
+            '\x1f'.join((video_language, category, tags)).encode('utf-8')
+        ).hexdigest()
+
+    def _load(self) -> None:
+        """Load the most recent persisted entries into memory."""
+        rows = self._db.execute(
+            "SELECT key, scope, result, embedding FROM responses "
+            "ORDER BY rowid DESC LIMIT ?",
+            (self.max_entries,)
+        ).fetchall()
+
+        for key, scope, result_json, embedding in reversed(rows):
+            result = json.loads(result_json)
+            self._entries[key] = result
+            if embedding is not None:
+                vector = self._normalize(np.frombuffer(embedding, dtype=np.float32))
+                if vector is not None:
+                    self._add_embedding(scope, vector, result)
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Look up an exact prompt match."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def get_similar(self, scope: str, embedding: np.ndarray) -> Optional[Dict[str, str]]:
+        """Look up the most similar cached context within a scope."""
+        with self._lock:
+            bucket = self._semantic.get(scope)
+            if bucket is None:
+                return None
+
+            query = self._normalize(embedding)
+            if query is None:
+                return None
+
+            # Rows are unit vectors, so one matrix-vector product gives all cosines
+            results, matrix = bucket
+            sims = matrix @ query
+            idx = int(sims.argmax())
+            if sims[idx] >= self.threshold:
+                return results[idx]
+            return None
+
+    def put(
+        self,
+        key: str,
+        scope: str,
+        result: Dict[str, str],
+        embedding: Optional[np.ndarray] = None
+    ) -> None:
+        """Insert a generated result into both tiers."""
+        if embedding is not None:
+            embedding = self._normalize(embedding)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if embedding is not None:
+                self._add_embedding(scope, embedding, result)
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, scope, result, embedding) VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    scope,
+                    json.dumps(result),
+                    embedding.tobytes() if embedding is not None else None
+                )
+            )
+
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._db.execute("DELETE FROM responses WHERE key = ?", (evicted,))
+
+            self._db.commit()
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> Optional[np.ndarray]:
+        """Return the embedding as a float32 unit vector, or None if it is all zeros."""
+        vector = np.array(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        vector /= norm
+        return vector
+
+    def _add_embedding(self, scope: str, embedding: np.ndarray, result: Dict[str, str]) -> None:
+        """Append a normalized embedding to its scope, dropping the oldest past the limit."""
+        row = embedding.reshape(1, -1)
+        bucket = self._semantic.get(scope)
+
+        if bucket is None or bucket[1].shape[1] != row.shape[1]:
+            self._semantic[scope] = ([result], row)
+            return
+
+        results, matrix = bucket
+        results.append(result)
+        matrix = np.vstack((matrix, row))
+        if len(results) > self.max_entries:
+            del results[0]
+            matrix = matrix[1:]
+        self._semantic[scope] = (results, matrix)
+
 
 class AIMetadataGenerator:
     """
@@ -37,7 +227,13 @@ class AIMetadataGenerator:
         """
         self.api_key = api_key or config.GEMINI_API_KEY
         self.model = None
+        self._available = False
         self._initialize_model()
+        self._cache = _ResponseCache(
+            config.AI_CACHE_FILE,
+            config.AI_CACHE_MAX_ENTRIES,
+            config.AI_SEMANTIC_CACHE_THRESHOLD
+        )
     
     def _initialize_model(self) -> None:
         """Initialize the Gemini AI model."""
@@ -47,9 +243,11 @@ class AIMetadataGenerator:
             
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self._available = True
             logger.info("AI Metadata Generator initialized successfully")
         
         except Exception as e:
+            self._available = False
             logger.error(f"Failed to initialize AI model: {str(e)}")
             raise
     
@@ -76,18 +274,165 @@ class AIMetadataGenerator:
             raise RuntimeError("AI model not initialized")
         
         prompt = self._build_prompt(video_context, video_language, category, tags)
+        cached, key, scope, embedding = self._lookup_cache(
+            prompt, video_context, video_language, category, tags
+        )
+        if cached is not None:
+            return cached
         
         try:
             response = self.model.generate_content(prompt)
             result = self._parse_response(response.text)
+            self._cache.put(key, scope, result, embedding)
             
             logger.info("AI metadata generated successfully")
-            return result
+            return dict(result)
         
         except Exception as e:
-            logger.error(f"Failed to generate AI metadata: {str(e)}")
+            logger.error("Failed to generate AI metadata: %s", e)
             raise
     
+    def generate_metadata_batch(
+        self,
+        items: List[Dict[str, str]],
+        concurrency: int = config.AI_BATCH_CONCURRENCY
+    ) -> List[Dict[str, str]]:
+        """
+        Generate metadata for several videos concurrently.
+        
+        Args:
+            items: List of dictionaries with 'video_context' and optional
+                   'video_language', 'category' and 'tags' keys
+            concurrency: Maximum number of in-flight Gemini requests
+            
+        Returns:
+            List of metadata dictionaries, in the same order as items
+        """
+        if not self.model:
+            raise RuntimeError("AI model not initialized")
+        
+        async def run_all() -> List[Dict[str, str]]:
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*[
+                self._generate_one(
+                    semaphore,
+                    item['video_context'],
+                    item.get('video_language', "Thai"),
+                    item.get('category', "Education"),
+                    item.get('tags', "")
+                )
+                for item in items
+            ])
+        
+        return asyncio.run(run_all())
+    
+    async def _generate_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        video_context: str,
+        video_language: str,
+        category: str,
+        tags: str
+    ) -> Dict[str, str]:
+        """
+        Generate metadata for a single batch item, retrying on rate limits.
+        
+        Args:
+            semaphore: Semaphore bounding concurrent requests
+            video_context: Video content description
+            video_language: Video language
+            category: YouTube category
+            tags: Existing tags
+            
+        Returns:
+            Dictionary with 'title', 'description', and 'tags' keys
+        """
+        prompt = self._build_prompt(video_context, video_language, category, tags)
+        # The lookup may call the embedding API, so it counts against the limit too
+        async with semaphore:
+            cached, key, scope, embedding = await asyncio.to_thread(
+                self._lookup_cache, prompt, video_context, video_language, category, tags
+            )
+        if cached is not None:
+            return cached
+        
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await self.model.generate_content_async(prompt)
+                break
+            except ResourceExhausted as e:
+                attempt += 1
+                if attempt >= config.MAX_RETRY_ATTEMPTS:
+                    logger.error("Failed to generate AI metadata after %d attempts: %s", attempt, e)
+                    raise
+                
+                delay = min(
+                    config.RETRY_INITIAL_DELAY * (config.RETRY_BACKOFF_MULTIPLIER ** (attempt - 1)),
+                    config.RETRY_MAX_DELAY
+                )
+                logger.warning("AI rate limit hit. Retrying in %.1fs...", delay)
+                await asyncio.sleep(delay)
+        
+        result = self._parse_response(response.text)
+        self._cache.put(key, scope, result, embedding)
+        return dict(result)
+    
+    def _lookup_cache(
+        self,
+        prompt: str,
+        video_context: str,
+        video_language: str,
+        category: str,
+        tags: str
+    ) -> Tuple[Optional[Dict[str, str]], str, Optional[str], Optional[np.ndarray]]:
+        """
+        Look up a prompt in the response cache.
+        
+        Args:
+            prompt: Built prompt
+            video_context: Video content description
+            video_language: Video language
+            category: YouTube category
+            tags: Existing tags
+            
+        Returns:
+            Tuple of (cached result or None, exact key, semantic scope, embedding)
+        """
+        key = self._cache.make_key(prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("AI metadata served from cache")
+            return dict(cached), key, None, None
+        
+        scope = self._cache.make_scope(video_language, category, tags)
+        embedding = self._embed(video_context)
+        if embedding is not None:
+            cached = self._cache.get_similar(scope, embedding)
+            if cached is not None:
+                logger.info("AI metadata served from semantic cache")
+                return dict(cached), key, scope, embedding
+        
+        return None, key, scope, embedding
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute an embedding for the semantic cache.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector, or None if embedding failed
+        """
+        try:
+            response = genai.embed_content(model=config.AI_EMBEDDING_MODEL, content=text)
+            return np.asarray(response['embedding'], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed video context, skipping semantic cache: {str(e)}")
+            return None
+    
     def _build_prompt(
         self,
         video_context: str,
@@ -107,41 +452,12 @@ class AIMetadataGenerator:
         Returns:
             Formatted prompt string
         """
-        prompt = f"""You are a YouTube SEO expert. Generate an optimized title and description for a YouTube video based on the following information:
-
-Video Content: {video_context}
-Language: {video_language}
-Category: {category}
-Existing Tags: {tags if tags else "None"}
-
-Requirements:
-1. Title (max 100 characters):
-   - Create a catchy, attention-grabbing title
-   - Include relevant keywords for SEO
-   - Use power words to increase click-through rate
-   - Make it compelling and click-worthy
-   - Avoid clickbait - be authentic
-
-2. Description (500-1000 characters):
-   - Start with a strong hook to engage viewers
-   - Include relevant keywords naturally
-   - Provide value and set expectations
-   - Include a call-to-action
-   - Add relevant hashtags (3-5)
-   - Format with paragraphs for readability
-   - Mention key topics covered
-
-3. Generate 5-7 additional relevant tags (comma-separated)
-
-Format your response exactly like this:
-
-TITLE: [Your title here]
-
-DESCRIPTION: [Your description here]
-
-TAGS: [tag1, tag2, tag3, tag4, tag5]"""
-        
-        return prompt
+        return _PROMPT_TEMPLATE.format_map({
+            'video_context': video_context,
+            'video_language': video_language,
+            'category': category,
+            'tags': tags or "None"
+        })
     
     def _parse_response(self, response_text: str) -> Dict[str, str]:
         """
@@ -153,43 +469,27 @@ TAGS: [tag1, tag2, tag3, tag4, tag5]"""
         Returns:
             Dictionary with 'title', 'description', and 'tags' keys
         """
+        match = _RESPONSE_RE.search(response_text)
         result = {
-            'title': '',
-            'description': '',
-            'tags': ''
+            'title': (match[1] or '').strip() if match else '',
+            'description': (match[2] or '').strip() if match else '',
+            'tags': (match[3] or '').strip() if match else ''
         }
         
-        try:
-            # Split response into sections
-            sections = response_text.split('\n\n')
-            
-            for section in sections:
-                section = section.strip()
-                if section.startswith('TITLE:'):
-                    result['title'] = section.replace('TITLE:', '').strip()
-                elif section.startswith('DESCRIPTION:'):
-                    result['description'] = section.replace('DESCRIPTION:', '').strip()
-                elif section.startswith('TAGS:'):
-                    result['tags'] = section.replace('TAGS:', '').strip()
-            
-            # Validate that we got all required fields
-            if not result['title']:
-                result['title'] = "Generated Title"
-            if not result['description']:
-                result['description'] = "Generated description"
-            
-            logger.debug(f"Parsed AI response - Title length: {len(result['title'])}, Description length: {len(result['description'])}")
-            
-            return result
+        # Validate that we got all required fields
+        if not result['title']:
+            result['title'] = "Generated Title"
+        if not result['description']:
+            result['description'] = "Generated description"
         
-        except Exception as e:
-            logger.error(f"Failed to parse AI response: {str(e)}")
-            # Return default values if parsing fails
-            return {
-                'title': 'AI Generated Title',
-                'description': 'AI generated description',
-                'tags': 'AI, generated'
-            }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed AI response - Title length: %d, Description length: %d",
+                len(result['title']),
+                len(result['description'])
+            )
+        
+        return result
     
     def is_available(self) -> bool:
         """
@@ -198,7 +498,7 @@ TAGS: [tag1, tag2, tag3, tag4, tag5]"""
         Returns:
             True if available, False otherwise
         """
-        return self.model is not None and self.api_key is not None
+        return self._available
 
 
 def generate_metadata_from_context(
@@ -3,15 +3,27 @@ YouTube Video Uploader - Streamlit Application
 A complete application for uploading videos to YouTube with OAuth 2.0 authentication.
 """
 
+import hashlib
+import io
 import logging
+import mmap
+import os
+import platform
+import re
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple
 
 import streamlit as st
-from google.oauth2.credentials import Credentials
 
 import config
+from logging_setup import setup_logging
 from oauth_manager import OAuthManager, AuthenticationError
 from youtube_client import (
     YouTubeClient,
@@ -20,32 +32,62 @@ from youtube_client import (
     NetworkError,
     UploadError
 )
-from ai_metadata_generator import AIMetadataGenerator
+
+if TYPE_CHECKING:
+    from ai_metadata_generator import AIMetadataGenerator
 
 # Check if credentials are configured in environment
 CREDENTIALS_CONFIGURED = bool(config.YOUTUBE_CLIENT_ID and config.YOUTUBE_CLIENT_SECRET)
 
-# Configure logging
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title=config.STREAMLIT_TITLE,
-    page_icon=config.STREAMLIT_PAGE_ICON,
-    layout=config.STREAMLIT_LAYOUT,
-    initial_sidebar_state="expanded"
-)
+# Buffer size for copying uploads to temp files
+_COPY_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MB
+
+# Temp copies are written with O_DIRECT on Linux, in multiples of this size
+_ODIRECT_SUPPORTED = hasattr(os, 'O_DIRECT') and platform.system() == 'Linux'
+_ODIRECT_ALIGNMENT = 4096
+
+# File uploader accepted extensions (without the leading dot) and help text
+_VIDEO_EXT_NAMES = tuple(ext[1:] for ext in config.SUPPORTED_VIDEO_FORMATS_DISPLAY)
+_VIDEO_EXT_HELP = f"Supported formats: {', '.join(config.SUPPORTED_VIDEO_FORMATS_DISPLAY)}"
+
+# Splits comma-separated tag input, trimming whitespace around each comma
+_COMMA_SPLIT = re.compile(r'\s*,\s*').split
+
+# Category selectbox options, in config order
+_CATEGORY_OPTIONS = tuple(config.VIDEO_CATEGORIES.values())
+
+# User-facing message for each upload error type
+_UPLOAD_ERROR_MESSAGES = {
+    FileValidationError: config.MSG_FILE_INVALID,
+    QuotaExceededError: config.MSG_QUOTA_EXCEEDED,
+    NetworkError: config.MSG_NETWORK_ERROR,
+    UploadError: config.MSG_UPLOAD_FAILED,
+}
+
+# Session state defaults, applied once per session
+_SESSION_DEFAULTS = {
+    'authenticated': False,
+    'oauth_manager': None,
+    'youtube_client': None,
+    'channel_info': None,
+    'uploaded_file': None,
+    'upload_progress': 0,
+    'upload_complete': False,
+    'upload_result': None,
+    'error_message': None,
+    'success_message': None,
+    'upload_clicked': False,
+    'thumbnail_file': None,
+    'upload_future': None,
+    'upload_temp_path': None,
+    'upload_progress_shared': None,
+    'pending_metadata': None,
+}
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -85,35 +127,217 @@ st.markdown("""
         background-color: #1f77b4;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title=config.STREAMLIT_TITLE,
+    page_icon=config.STREAMLIT_PAGE_ICON,
+    layout=config.STREAMLIT_LAYOUT,
+    initial_sidebar_state="expanded"
+)
+
+# Apply custom CSS
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+@dataclass(slots=True)
+class VideoMetadata:
+    """Snapshot of the metadata widgets, taken when Upload is clicked."""
+    title: str
+    description: str
+    tags: Tuple[str, ...]
+    category: str
+    privacy_status: str
+    recording_date: Optional[date]
+    video_language: str
+    altered_content: str
+    paid_promotion: bool
+    thumbnail: Optional[BinaryIO]
+
+
+def _hash_secret(secret: str) -> str:
+    """Return a short, non-reversible cache key for a secret value."""
+    return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+
+@st.cache_resource(show_spinner=False)
+def _get_oauth_manager(client_id: str, secret_hash: str, _client_secret: str) -> OAuthManager:
+    """
+    Return a process-wide OAuth manager for the given client credentials.
+    
+    The leading underscore keeps Streamlit from hashing the secret itself;
+    secret_hash keys the cache instead.
+    """
+    return OAuthManager(client_id, _client_secret)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_generator(api_key: str) -> "AIMetadataGenerator":
+    """Return a process-wide AI metadata generator for the given API key."""
+    # Imported here so the Gemini SDK only loads once AI generation is used
+    from ai_metadata_generator import AIMetadataGenerator
+    return AIMetadataGenerator(api_key)
+
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def _cached_generate(
+    video_context: str,
+    video_language: str,
+    category: str,
+    tags: str,
+    api_key_hash: str
+) -> dict:
+    """
+    Generate AI metadata, memoized across reruns and sessions.
+    
+    api_key_hash only partitions the cache per API key, so the key itself
+    is never stored in Streamlit's cache.
+    """
+    return _get_generator(config.GEMINI_API_KEY).generate_metadata(
+        video_context=video_context,
+        video_language=video_language,
+        category=category,
+        tags=tags
+    )
 
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
-    if 'authenticated' not in st.session_state:
-        st.session_state.authenticated = False
-    if 'oauth_manager' not in st.session_state:
-        st.session_state.oauth_manager = None
-    if 'youtube_client' not in st.session_state:
-        st.session_state.youtube_client = None
-    if 'channel_info' not in st.session_state:
-        st.session_state.channel_info = None
-    if 'uploaded_file' not in st.session_state:
-        st.session_state.uploaded_file = None
-    if 'upload_progress' not in st.session_state:
-        st.session_state.upload_progress = 0
-    if 'upload_complete' not in st.session_state:
-        st.session_state.upload_complete = False
-    if 'upload_result' not in st.session_state:
-        st.session_state.upload_result = None
-    if 'error_message' not in st.session_state:
-        st.session_state.error_message = None
-    if 'success_message' not in st.session_state:
-        st.session_state.success_message = None
-    if 'upload_clicked' not in st.session_state:
-        st.session_state.upload_clicked = False
-    if 'thumbnail_file' not in st.session_state:
-        st.session_state.thumbnail_file = None
+    # upload_executor is created last, so its presence means this already ran
+    if 'upload_executor' in st.session_state:
+        return
+    
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    
+    # Mutable per-session values can't live in the shared defaults
+    st.session_state.setdefault('temp_files', {})
+    
+    # One upload worker per session; created once so reruns don't spawn executors
+    st.session_state.upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload")
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    """Write all of data to fd, retrying short writes."""
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _write_temp_odirect(src_fileobj, dst_path: str) -> bool:
+    """
+    Copy a file object to dst_path with O_DIRECT, bypassing the page cache.
+    The temp copy is only read back once by the upload, so caching it would
+    just evict more useful pages.
+    
+    Args:
+        src_fileobj: Binary file object to copy from
+        dst_path: Existing file to write to
+        
+    Returns:
+        True if the file was written, False if O_DIRECT is unusable here
+    """
+    import fcntl
+    
+    try:
+        fd = os.open(dst_path, os.O_WRONLY | os.O_DIRECT)
+    except OSError:
+        return False
+    
+    # Anonymous mmaps are page-aligned, as O_DIRECT requires
+    try:
+        with mmap.mmap(-1, _COPY_CHUNK_SIZE) as buf, memoryview(buf) as view:
+            direct = True
+            while n := src_fileobj.readinto(view):
+                tail = n % _ODIRECT_ALIGNMENT if direct else 0
+                _write_all(fd, view[:n - tail])
+                if tail:
+                    # The unaligned final chunk has to go through the page cache
+                    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                    fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+                    direct = False
+                    _write_all(fd, view[n - tail:n])
+    except OSError as e:
+        logger.debug("O_DIRECT write failed, falling back to buffered copy: %s", e)
+        src_fileobj.seek(0)
+        return False
+    finally:
+        os.close(fd)
+    
+    return True
+
+
+def _split_tags(tags_input: str) -> list:
+    """Split comma-separated tag input into a list of non-empty tags."""
+    return [tag for tag in _COMMA_SPLIT(tags_input.strip()) if tag]
+
+
+def _save_temp_upload(uploaded_file) -> str:
+    """
+    Copy an uploaded file to a unique temp file in config.TEMP_DIR.
+    The copy is made once per upload; reruns reuse it by file ID.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        
+    Returns:
+        Path of the temp file
+    """
+    _prune_temp_files(uploaded_file.file_id)
+    temp_files = st.session_state.temp_files
+    temp_path = temp_files.get(uploaded_file.file_id)
+    
+    if temp_path is None:
+        uploaded_file.seek(0)
+        with tempfile.NamedTemporaryFile(
+            delete=False,
+            dir=config.TEMP_DIR,
+            suffix=Path(uploaded_file.name).suffix
+        ) as f:
+            if not (_ODIRECT_SUPPORTED and _write_temp_odirect(uploaded_file, f.name)):
+                shutil.copyfileobj(uploaded_file, f, length=_COPY_CHUNK_SIZE)
+        temp_path = temp_files[uploaded_file.file_id] = f.name
+    
+    return temp_path
+
+
+def _prune_temp_files(keep_file_id: Optional[str]) -> None:
+    """
+    Delete temp copies of files that are no longer selected in the uploader.
+    A copy that a running upload is still reading is kept for a later rerun.
+    
+    Args:
+        keep_file_id: File ID of the current selection, or None
+    """
+    future = st.session_state.upload_future
+    in_flight = st.session_state.upload_temp_path if future is not None and not future.done() else None
+    temp_files = st.session_state.temp_files
+    for file_id, temp_path in list(temp_files.items()):
+        if file_id != keep_file_id and temp_path != in_flight:
+            Path(temp_path).unlink(missing_ok=True)
+            del temp_files[file_id]
+
+
+@st.cache_resource(show_spinner=False)
+def _sweep_temp_dir() -> None:
+    """
+    Delete temp copies left behind by a previous run of the app.
+    Cached so it runs once per process, before any session has made a copy.
+    """
+    with os.scandir(config.TEMP_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    logger.warning("Could not remove stale temp file %s: %s", entry.path, e)
+
+
+def _clear_temp_files():
+    """Delete all temp files created for this session."""
+    for temp_path in st.session_state.temp_files.values():
+        Path(temp_path).unlink(missing_ok=True)
+    st.session_state.temp_files.clear()
 
 
 def render_sidebar():
@@ -155,10 +379,17 @@ def render_sidebar():
     
     # Check if credentials are provided
     if client_id and client_secret:
-        # Initialize OAuth manager if not already done
-        if st.session_state.oauth_manager is None:
-            st.session_state.oauth_manager = OAuthManager(client_id, client_secret)
-        
+        # Get the shared OAuth manager for these credentials (cached per process)
+        st.session_state.oauth_manager = _get_oauth_manager(
+            client_id, _hash_secret(client_secret), client_secret
+        )
+
+        # Refresh the token ahead of expiry so later API calls don't have to
+        try:
+            st.session_state.oauth_manager.ensure_fresh(skew=60)
+        except AuthenticationError as e:
+            logger.warning("Token refresh failed: %s", e)
+
         # Check authentication status
         if st.session_state.oauth_manager.is_authenticated():
             st.session_state.authenticated = True
@@ -270,25 +501,26 @@ def render_main_interface():
     # File uploader
     uploaded_file = st.file_uploader(
         "Select a video file",
-        type=[ext[1:] for ext in config.SUPPORTED_VIDEO_FORMATS],
-        help=f"Supported formats: {', '.join(config.SUPPORTED_VIDEO_FORMATS)}",
+        type=_VIDEO_EXT_NAMES,
+        help=_VIDEO_EXT_HELP,
         key="video_uploader"
     )
     
+    if not uploaded_file:
+        # The selection was cleared; drop copies of earlier files
+        _prune_temp_files(None)
+    
     if uploaded_file:
         # Save uploaded file temporarily
-        temp_file_path = Path(f"temp_{uploaded_file.name}")
-        with open(temp_file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        st.session_state.uploaded_file = str(temp_file_path)
+        file_size = uploaded_file.size
+        st.session_state.uploaded_file = _save_temp_upload(uploaded_file)
         
         # Show file info
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("File Name", uploaded_file.name)
         with col2:
-            st.metric("File Size", f"{len(uploaded_file.getbuffer()) / (1024**2):.2f} MB")
+            st.metric("File Size", f"{file_size / (1 << 20):.2f} MB")
         with col3:
             st.metric("File Type", uploaded_file.type)
         
@@ -305,20 +537,16 @@ def render_main_interface():
         )
         
         if thumbnail_file:
-            # Save thumbnail temporarily
-            temp_thumbnail_path = Path(f"temp_thumbnail_{thumbnail_file.name}")
-            with open(temp_thumbnail_path, "wb") as f:
-                f.write(thumbnail_file.getbuffer())
-            
-            st.session_state.thumbnail_file = str(temp_thumbnail_path)
+            # Thumbnails are small; keep them in memory instead of a temp file
+            st.session_state.thumbnail_file = thumbnail_file
             
-            # Display thumbnail preview
+            # Display thumbnail preview from the in-memory upload
             col1, col2 = st.columns([1, 2])
             with col1:
-                st.image(temp_thumbnail_path, caption="Thumbnail Preview", width=200)
+                st.image(thumbnail_file.getvalue(), caption="Thumbnail Preview", width=200)
             with col2:
                 st.metric("File Name", thumbnail_file.name)
-                st.metric("File Size", f"{len(thumbnail_file.getbuffer()) / (1024**2):.2f} MB")
+                st.metric("File Size", f"{thumbnail_file.size / (1 << 20):.2f} MB")
         
         st.markdown("---")
         
@@ -358,15 +586,13 @@ def render_main_interface():
                         current_tags = st.session_state.get('video_tags', 'AI')
                         current_language = st.session_state.get('video_language', 'Thai')
                         
-                        # Initialize AI generator
-                        ai_generator = AIMetadataGenerator()
-                        
                         # Generate metadata
-                        ai_result = ai_generator.generate_metadata(
-                            video_context=video_context,
-                            video_language=current_language,
-                            category=current_category,
-                            tags=current_tags
+                        ai_result = _cached_generate(
+                            video_context,
+                            current_language,
+                            current_category,
+                            current_tags,
+                            _hash_secret(config.GEMINI_API_KEY)
                         )
                         
                         # Update session state with AI-generated values
@@ -374,11 +600,12 @@ def render_main_interface():
                         st.session_state.video_description = ai_result['description']
                         
                         # Merge AI-generated tags with existing tags
+                        # (order-preserving, case-insensitive; earlier tags weigh more)
                         if ai_result['tags']:
-                            existing_tags = [tag.strip() for tag in current_tags.split(',') if tag.strip()]
-                            ai_tags = [tag.strip() for tag in ai_result['tags'].split(',') if tag.strip()]
-                            merged_tags = list(set(existing_tags + ai_tags))
-                            st.session_state.video_tags = ', '.join(merged_tags)
+                            merged_tags = {}
+                            for tag in (*_split_tags(current_tags), *_split_tags(ai_result['tags'])):
+                                merged_tags.setdefault(tag.lower(), tag)
+                            st.session_state.video_tags = ', '.join(merged_tags.values())
                         
                         st.success("✅ AI-generated metadata applied successfully!")
                         st.rerun()
@@ -395,7 +622,7 @@ def render_main_interface():
         # Title
         title = st.text_input(
             "Title *",
-            value=uploaded_file.name.rsplit('.', 1)[0],
+            value=Path(uploaded_file.name).stem,
             help="Enter a descriptive title for your video",
             key="video_title"
         )
@@ -417,20 +644,17 @@ def render_main_interface():
             help="Add relevant tags to help viewers find your video",
             key="video_tags"
         )
-        tags = [tag.strip() for tag in tags_input.split(',') if tag.strip()] if tags_input else []
+        tags = _split_tags(tags_input) if tags_input else []
         
         # Category
         category = st.selectbox(
             "Category",
-            options=list(config.VIDEO_CATEGORIES.values()),
+            options=_CATEGORY_OPTIONS,
             index=14,  # Default to "Education"
             help="Select the category that best describes your video",
             key="video_category"
         )
-        category_id = next(
-            (k for k, v in config.VIDEO_CATEGORIES.items() if v == category),
-            "22"
-        )
+        category_id = config.VIDEO_CATEGORIES_BY_NAME.get(category, "22")
         
         # Privacy Status
         privacy_status = st.selectbox(
@@ -452,7 +676,7 @@ def render_main_interface():
             chunk_size_mb = st.selectbox(
                 "Upload Chunk Size",
                 options=[5, 10, 20, 50, 100],
-                index=2,  # Default to 20MB
+                index=4,  # Default to 100MB
                 help="Larger chunks can improve upload speed but may use more memory",
                 key="chunk_size_mb"
             )
@@ -493,10 +717,9 @@ def render_main_interface():
         st.header("⚙️ Additional Settings")
         
         # Recording Date
-        from datetime import datetime
         recording_date = st.date_input(
             "Recording Date",
-            value=datetime.now().date(),
+            value=date.today(),
             help="The date when the video was recorded",
             key="recording_date"
         )
@@ -529,9 +752,10 @@ def render_main_interface():
         
         # Metadata summary
         with st.expander("📋 Metadata Summary"):
+            desc_preview = description if len(description) <= 100 else description[:100] + "..."
             summary_data = {
                 "title": title,
-                "description": description[:100] + "..." if len(description) > 100 else description,
+                "description": desc_preview,
                 "tags": tags,
                 "category": category,
                 "category_id": category_id,
@@ -562,7 +786,23 @@ def render_main_interface():
             if not title:
                 st.error("Please enter a title for your video")
             else:
-                # Start upload
+                # Start upload with a snapshot of the current metadata
+                thumbnail = None
+                if st.session_state.thumbnail_file:
+                    thumbnail = io.BytesIO(st.session_state.thumbnail_file.getvalue())
+                    thumbnail.name = st.session_state.thumbnail_file.name
+                st.session_state.pending_metadata = VideoMetadata(
+                    title=title,
+                    description=description,
+                    tags=tuple(tags),
+                    category=category_id,
+                    privacy_status=privacy_status,
+                    recording_date=recording_date,
+                    video_language=video_language,
+                    altered_content=altered_content,
+                    paid_promotion=paid_promotion,
+                    thumbnail=thumbnail
+                )
                 st.session_state.upload_complete = False
                 st.session_state.upload_progress = 0
                 st.session_state.upload_clicked = True
@@ -581,12 +821,13 @@ def render_upload_success():
     st.markdown(f'<div class="success-box">{config.MSG_UPLOAD_SUCCESS}</div>', unsafe_allow_html=True)
     
     # Video details
+    file_size = result['file_size']
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Video Information")
         st.write(f"**Title:** {result['title']}")
         st.write(f"**Video ID:** {result['video_id']}")
-        st.write(f"**File Size:** {result['file_size'] / (1024**2):.2f} MB")
+        st.write(f"**File Size:** {file_size / (1 << 20):.2f} MB")
     
     with col2:
         st.subheader("Links")
@@ -598,30 +839,25 @@ def render_upload_success():
     # Reset button
     st.markdown("---")
     if st.button("🔄 Upload Another Video", key="upload_another_btn"):
+        # Clean up temp files before their paths are cleared
+        _clear_temp_files()
+        st.session_state.thumbnail_file = None
+        
         st.session_state.upload_complete = False
         st.session_state.upload_result = None
         st.session_state.uploaded_file = None
         st.session_state.upload_progress = 0
         
-        # Clean up temp files
-        if st.session_state.uploaded_file:
-            temp_file = Path(st.session_state.uploaded_file)
-            if temp_file.exists():
-                temp_file.unlink()
-        
-        # Clean up thumbnail file
-        if st.session_state.thumbnail_file:
-            temp_thumbnail = Path(st.session_state.thumbnail_file)
-            if temp_thumbnail.exists():
-                temp_thumbnail.unlink()
-            st.session_state.thumbnail_file = None
-        
         st.rerun()
 
 
 def handle_upload():
-    """Handle the video upload process with progress tracking."""
-    if not st.session_state.uploaded_file:
+    """Start the video upload on the background upload executor."""
+    if not st.session_state.uploaded_file or st.session_state.pending_metadata is None:
+        return
+    
+    # Ignore repeat clicks while an upload is still running
+    if st.session_state.upload_future is not None and not st.session_state.upload_future.done():
         return
     
     # Check if YouTube client is initialized
@@ -631,110 +867,107 @@ def handle_upload():
         st.rerun()
         return
     
-    # Get metadata from session state
-    metadata = {
-        'title': st.session_state.get('video_title', 'Untitled'),
-        'description': st.session_state.get('video_description', ''),
-        'tags': [tag.strip() for tag in st.session_state.get('video_tags', '').split(',') if tag.strip()],
-        'category': st.session_state.get('video_category_id', '22'),
-        'privacy_status': st.session_state.get('privacy_status', 'private'),
-        'recording_date': st.session_state.get('recording_date'),
-        'video_language': st.session_state.get('video_language'),
-        'altered_content': st.session_state.get('altered_content'),
-        'paid_promotion': st.session_state.get('paid_promotion', False),
-        'thumbnail': st.session_state.get('thumbnail_file')
+    # Metadata snapshot taken when the upload button was clicked
+    metadata = asdict(st.session_state.pending_metadata)
+    
+    # Get upload settings from UI
+    upload_settings = {
+        'chunk_size': st.session_state.get('chunk_size_mb', 100) * 1024 * 1024,  # Convert MB to bytes
+        'bandwidth_limit': st.session_state.get('bandwidth_limit_mbps', 0) * 1024 * 1024,  # Convert Mbps to bytes/sec
+        'max_retries': st.session_state.get('max_retries', 5),
+        'timeout': st.session_state.get('timeout_seconds', 30)
     }
     
-    # Create progress bar
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    # Update config with user settings
+    config.UPLOAD_CHUNK_SIZE = upload_settings['chunk_size']
+    config.UPLOAD_BANDWIDTH_LIMIT = upload_settings['bandwidth_limit']
+    config.MAX_RETRY_ATTEMPTS = upload_settings['max_retries']
+    config.UPLOAD_CONNECTION_TIMEOUT = upload_settings['timeout']
+    
+    # The upload thread gets its own client: its HTTP connection is not
+    # thread-safe, so it must not be shared with the sidebar or other sessions
+    credentials = st.session_state.oauth_manager.get_credentials()
+    if not credentials:
+        st.session_state.error_message = "YouTube client not initialized. Please authenticate again."
+        st.session_state.upload_clicked = False
+        st.rerun()
+        return
+    upload_client = YouTubeClient(credentials)
+    
+    # Progress is shared with the upload thread; it must not touch st.session_state
+    shared_progress = {'lock': threading.Lock(), 'bytes_uploaded': 0, 'total_bytes': 0}
     
-    # Progress callback
     def progress_callback(bytes_uploaded: int, total_bytes: int):
-        progress = bytes_uploaded / total_bytes
-        st.session_state.upload_progress = progress
-        progress_bar.progress(progress)
-        status_text.text(f"Uploading... {progress * 100:.1f}% ({bytes_uploaded / (1024**2):.1f} MB / {total_bytes / (1024**2):.1f} MB)")
+        with shared_progress['lock']:
+            shared_progress['bytes_uploaded'] = bytes_uploaded
+            shared_progress['total_bytes'] = total_bytes
+    
+    st.session_state.upload_progress_shared = shared_progress
+    st.session_state.upload_temp_path = st.session_state.uploaded_file
+    st.session_state.upload_future = st.session_state.upload_executor.submit(
+        upload_client.upload_video,
+        st.session_state.uploaded_file,
+        metadata,
+        progress_callback
+    )
+    st.rerun()
+
+
+def render_upload_progress():
+    """Render progress for the running upload and collect its result when done."""
+    future = st.session_state.upload_future
+    shared_progress = st.session_state.upload_progress_shared
+    
+    with shared_progress['lock']:
+        bytes_uploaded = shared_progress['bytes_uploaded']
+        total_bytes = shared_progress['total_bytes']
+    
+    progress = bytes_uploaded / total_bytes if total_bytes else 0.0
+    st.session_state.upload_progress = progress
+    st.progress(progress)
+    
+    if not future.done():
+        st.text(f"Uploading... {progress * 100:.1f}% ({bytes_uploaded >> 20} MB / {total_bytes / (1 << 20):.1f} MB)")
+        time.sleep(config.UPLOAD_STATUS_POLL_INTERVAL)
+        st.rerun()
+        return
+    
+    st.session_state.upload_future = None
+    st.session_state.upload_progress_shared = None
     
     try:
-        # Get upload settings from UI
-        upload_settings = {
-            'chunk_size': st.session_state.get('chunk_size_mb', 20) * 1024 * 1024,  # Convert MB to bytes
-            'bandwidth_limit': st.session_state.get('bandwidth_limit_mbps', 0) * 1024 * 1024,  # Convert Mbps to bytes/sec
-            'max_retries': st.session_state.get('max_retries', 5),
-            'timeout': st.session_state.get('timeout_seconds', 30)
-        }
-        
-        # Update config with user settings
-        config.UPLOAD_CHUNK_SIZE = upload_settings['chunk_size']
-        config.UPLOAD_BANDWIDTH_LIMIT = upload_settings['bandwidth_limit']
-        config.MAX_RETRY_ATTEMPTS = upload_settings['max_retries']
-        config.UPLOAD_CONNECTION_TIMEOUT = upload_settings['timeout']
-        
-        # Reinitialize YouTube client with new settings
-        credentials = st.session_state.oauth_manager.get_credentials()
-        st.session_state.youtube_client = YouTubeClient(credentials)
-        
-        # Perform upload with optimized settings
-        result = st.session_state.youtube_client.upload_video(
-            st.session_state.uploaded_file,
-            metadata,
-            progress_callback
-        )
-        
-        # Update progress to 100%
-        progress_bar.progress(1.0)
-        status_text.text("Upload complete!")
+        result = future.result()
         
         # Store result
+        st.session_state.upload_progress = 1.0
         st.session_state.upload_result = result
         st.session_state.upload_complete = True
         st.session_state.success_message = config.MSG_UPLOAD_SUCCESS
-        st.session_state.upload_clicked = False  # Reset the flag
         
         # Clean up temp files
-        temp_file = Path(st.session_state.uploaded_file)
-        if temp_file.exists():
-            temp_file.unlink()
-        
-        # Clean up thumbnail file
-        if st.session_state.thumbnail_file:
-            temp_thumbnail = Path(st.session_state.thumbnail_file)
-            if temp_thumbnail.exists():
-                temp_thumbnail.unlink()
-            st.session_state.thumbnail_file = None
-        
-        st.rerun()
-    
-    except FileValidationError as e:
-        st.session_state.error_message = f"{config.MSG_FILE_INVALID}\n\n{str(e)}"
-        st.session_state.upload_clicked = False  # Reset the flag
-        st.rerun()
-    
-    except QuotaExceededError as e:
-        st.session_state.error_message = f"{config.MSG_QUOTA_EXCEEDED}\n\n{str(e)}"
-        st.session_state.upload_clicked = False  # Reset the flag
-        st.rerun()
-    
-    except NetworkError as e:
-        st.session_state.error_message = f"{config.MSG_NETWORK_ERROR}\n\n{str(e)}"
-        st.session_state.upload_clicked = False  # Reset the flag
-        st.rerun()
+        _clear_temp_files()
+        st.session_state.thumbnail_file = None
     
-    except UploadError as e:
-        st.session_state.error_message = f"{config.MSG_UPLOAD_FAILED}\n\n{str(e)}"
-        st.session_state.upload_clicked = False  # Reset the flag
-        st.rerun()
+    except (FileValidationError, QuotaExceededError, NetworkError, UploadError) as e:
+        st.session_state.error_message = f"{_UPLOAD_ERROR_MESSAGES[type(e)]}\n\n{str(e)}"
     
     except Exception as e:
         st.session_state.error_message = f"Unexpected error: {str(e)}"
+        logger.error("Unexpected error during upload: %s", e, exc_info=True)
+    
+    finally:
         st.session_state.upload_clicked = False  # Reset the flag
-        logger.error(f"Unexpected error during upload: {str(e)}", exc_info=True)
         st.rerun()
 
 
 def main():
     """Main application entry point."""
+    # Configure logging
+    setup_logging()
+    
+    # Remove temp copies orphaned by an earlier run
+    _sweep_temp_dir()
+    
     # Initialize session state
     initialize_session_state()
     
@@ -749,6 +982,10 @@ def main():
         if st.session_state.upload_clicked:
             st.session_state.upload_clicked = False  # Reset the flag
             handle_upload()
+    
+    # Poll the background upload
+    if st.session_state.upload_future is not None:
+        render_upload_progress()
 
 
 if __name__ == "__main__":
@@ -3,52 +3,126 @@ Application configuration for YouTube Video Uploader.
 Centralized settings for API, upload parameters, and paths.
 """
 
+import functools
+import importlib.util
 import os
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Project paths
-BASE_DIR = Path(__file__).parent.absolute()
-DATA_DIR = BASE_DIR / "data"
-TOKENS_DIR = DATA_DIR / "tokens"
-LOGS_DIR = BASE_DIR / "logs"
-
-# Ensure directories exist
-TOKENS_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+import sys
+from types import MappingProxyType
+
+# Project paths (plain strings; every consumer accepts str paths)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+TOKENS_DIR = os.path.join(DATA_DIR, "tokens")
+LOGS_DIR = os.path.join(BASE_DIR, "logs")
+TEMP_DIR = os.path.join(DATA_DIR, "tmp")  # Temporary copies of uploaded files
+
+_ENV_FILE = os.path.join(BASE_DIR, ".env")
+_COMPILED_ENV_FILE = os.path.join(DATA_DIR, "env_compiled.py")
+
+
+@functools.cache
+def _load_env() -> None:
+    """
+    Load environment variables from the .env file, at most once per process.
+    Uses data/env_compiled.py (see scripts/compile_env.py) when it is at least
+    as new as .env, so startup skips parsing .env; otherwise falls back to
+    python-dotenv.
+    """
+    try:
+        if os.stat(_COMPILED_ENV_FILE).st_mtime >= os.stat(_ENV_FILE).st_mtime:
+            spec = importlib.util.spec_from_file_location("env_compiled", _COMPILED_ENV_FILE)
+            spec.loader.exec_module(importlib.util.module_from_spec(spec))
+            return
+    except OSError:
+        pass
+    
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# Ensure directories exist (one stat each once they have been created)
+for _directory in (TOKENS_DIR, LOGS_DIR, TEMP_DIR):
+    if not os.path.isdir(_directory):
+        os.makedirs(_directory, exist_ok=True)
+del _directory
 
 # YouTube API configuration
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
-YOUTUBE_UPLOAD_SCOPE = "https://www.googleapis.com/auth/youtube.upload"
-YOUTUBE_READ_WRITE_SCOPE = "https://www.googleapis.com/auth/youtube"
+YOUTUBE_UPLOAD_SCOPE = sys.intern("https://www.googleapis.com/auth/youtube.upload")
+YOUTUBE_READ_WRITE_SCOPE = sys.intern("https://www.googleapis.com/auth/youtube")
 
 # OAuth 2.0 configuration
-OAUTH_SCOPES = [
+OAUTH_SCOPES = (
     YOUTUBE_UPLOAD_SCOPE,
     YOUTUBE_READ_WRITE_SCOPE,
-]
-OAUTH_PORT = int(os.getenv('OAUTH_PORT', '8080'))  # Port for OAuth local server (can be overridden via .env)
-OAUTH_REDIRECT_URI = f"http://localhost:{OAUTH_PORT}"  # OAuth callback URI
-OAUTH_TOKEN_FILE = TOKENS_DIR / "youtube_token.json"
-OAUTH_ENCRYPTION_KEY_FILE = TOKENS_DIR / ".encryption_key"
+)
+OAUTH_TOKEN_FILE = os.path.join(TOKENS_DIR, "youtube_token.json")
+OAUTH_ENCRYPTION_KEY_FILE = os.path.join(TOKENS_DIR, ".encryption_key")
+
+def _read_oauth_port() -> int:
+    """
+    Read and validate OAUTH_PORT from the environment.
+    
+    Raises:
+        ValueError: If the value is not a valid TCP port number
+    """
+    raw = os.getenv('OAUTH_PORT', '8080')
+    try:
+        port = int(raw)
+    except ValueError:
+        port = 0
+    if not 0 < port < 65536:
+        raise ValueError(f"OAUTH_PORT must be a port number between 1 and 65535, got {raw!r}")
+    return port
+
+
+# Settings read from environment variables (or .env) on first access; see __getattr__
+_ENV_SETTINGS = {
+    # Port for OAuth local server (can be overridden via .env)
+    'OAUTH_PORT': _read_oauth_port,
+    # OAuth callback URI
+    'OAUTH_REDIRECT_URI': lambda: f"http://localhost:{sys.modules[__name__].OAUTH_PORT}",
+    # YouTube API credentials
+    'YOUTUBE_CLIENT_ID': lambda: os.getenv('YOUTUBE_CLIENT_ID', ''),
+    'YOUTUBE_CLIENT_SECRET': lambda: os.getenv('YOUTUBE_CLIENT_SECRET', ''),
+    # Google Generative AI API key
+    'GEMINI_API_KEY': lambda: os.getenv('GEMINI_API_KEY', ''),
+}
 
-# YouTube API credentials (from environment variables)
-YOUTUBE_CLIENT_ID = os.getenv('YOUTUBE_CLIENT_ID', '')
-YOUTUBE_CLIENT_SECRET = os.getenv('YOUTUBE_CLIENT_SECRET', '')
 
-# Google Generative AI API key (from environment variables)
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+def __getattr__(name: str):
+    """
+    Resolve environment-backed settings lazily (PEP 562).
+    The .env file is only loaded once one of them is first read; the value
+    is then cached as a regular module attribute.
+    """
+    try:
+        resolve = _ENV_SETTINGS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    _load_env()
+    value = globals()[name] = resolve()
+    return value
+
+
+# AI metadata response cache
+AI_CACHE_FILE = os.path.join(DATA_DIR, "ai_cache.sqlite")
+AI_CACHE_MAX_ENTRIES = 512
+AI_EMBEDDING_MODEL = "models/text-embedding-004"
+AI_SEMANTIC_CACHE_THRESHOLD = 0.93  # Minimum cosine similarity for a near-duplicate hit
+AI_BATCH_CONCURRENCY = 8  # Maximum in-flight Gemini requests for batch generation
 
 # Upload configuration
-UPLOAD_CHUNK_SIZE = 20 * 1024 * 1024  # 20 MB chunks (increased from 5MB for better performance)
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024  # Resumable upload chunks must be a multiple of 256 KiB
+UPLOAD_CHUNK_SIZE = 100 * 1024 * 1024  # 100 MB chunks; -1 sends the whole file in one request
 MAX_FILE_SIZE = 256 * 1024 * 1024 * 1024  # 256 GB (YouTube limit)
-SUPPORTED_VIDEO_FORMATS = [
+# Ordered for display; SUPPORTED_VIDEO_FORMATS is the set used for membership checks
+SUPPORTED_VIDEO_FORMATS_DISPLAY = (
     ".mp4", ".mov", ".avi", ".flv", ".wmv", ".webm", ".mkv", ".mpeg", ".mpg"
-]
+)
+SUPPORTED_VIDEO_FORMATS = frozenset(SUPPORTED_VIDEO_FORMATS_DISPLAY)
 
 # Connection optimization
 UPLOAD_CONNECTION_TIMEOUT = 30  # seconds
@@ -73,9 +147,10 @@ RETRY_BACKOFF_MULTIPLIER = 1.5  # Reduced for faster retries
 
 # Progress reporting
 PROGRESS_UPDATE_INTERVAL = 0.1  # seconds
+UPLOAD_STATUS_POLL_INTERVAL = 0.5  # seconds between UI refreshes while uploading in the background
 
 # Logging configuration
-LOG_FILE = LOGS_DIR / "youtube_uploader.log"
+LOG_FILE = os.path.join(LOGS_DIR, "youtube_uploader.log")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL = "INFO"
 
@@ -85,17 +160,17 @@ STREAMLIT_PAGE_ICON = "📹"
 STREAMLIT_LAYOUT = "wide"
 STREAMLIT_LOGO = "assets/logo.png"
 
-# UI Messages
-MSG_AUTH_SUCCESS = "✅ Successfully authenticated with YouTube!"
-MSG_AUTH_FAILED = "❌ Authentication failed. Please check your credentials."
-MSG_UPLOAD_SUCCESS = "✅ Video uploaded successfully!"
-MSG_UPLOAD_FAILED = "❌ Upload failed. Please try again."
-MSG_FILE_INVALID = "❌ Invalid file format. Please upload a video file."
-MSG_FILE_TOO_LARGE = f"❌ File size exceeds YouTube's limit of {MAX_FILE_SIZE / (1024**3):.0f} GB."
-MSG_QUOTA_EXCEEDED = "⚠️ API quota exceeded. Please try again later."
-MSG_NETWORK_ERROR = "⚠️ Network error. Retrying..."
-
-# Video categories (YouTube API category IDs)
+# UI Messages (interned)
+MSG_AUTH_SUCCESS = sys.intern("✅ Successfully authenticated with YouTube!")
+MSG_AUTH_FAILED = sys.intern("❌ Authentication failed. Please check your credentials.")
+MSG_UPLOAD_SUCCESS = sys.intern("✅ Video uploaded successfully!")
+MSG_UPLOAD_FAILED = sys.intern("❌ Upload failed. Please try again.")
+MSG_FILE_INVALID = sys.intern("❌ Invalid file format. Please upload a video file.")
+MSG_FILE_TOO_LARGE = sys.intern(f"❌ File size exceeds YouTube's limit of {MAX_FILE_SIZE / (1024**3):.0f} GB.")
+MSG_QUOTA_EXCEEDED = sys.intern("⚠️ API quota exceeded. Please try again later.")
+MSG_NETWORK_ERROR = sys.intern("⚠️ Network error. Retrying...")
+
+# Video categories (YouTube API category IDs); read-only, with interned strings
 VIDEO_CATEGORIES = {
     "1": "Film & Animation",
     "2": "Autos & Vehicles",
@@ -130,6 +205,11 @@ VIDEO_CATEGORIES = {
     "43": "Shows",
     "44": "Trailers",
 }
+VIDEO_CATEGORIES = MappingProxyType({
+    sys.intern(category_id): sys.intern(name) for category_id, name in VIDEO_CATEGORIES.items()
+})
+# Reverse lookup (name -> ID); built in reverse so duplicate names keep their first ID
+VIDEO_CATEGORIES_BY_NAME = MappingProxyType({v: k for k, v in reversed(VIDEO_CATEGORIES.items())})
 
 # Privacy status options
 PRIVACY_STATUS_OPTIONS = ["public", "unlisted", "private"]
@@ -0,0 +1,57 @@
+"""
+Logging configuration for YouTube Video Uploader.
+Installs the application's log handlers once per process.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional, Union
+
+import config
+
+
+def setup_logging(
+    level: Union[int, str] = config.LOG_LEVEL,
+    file: Optional[str] = config.LOG_FILE
+) -> None:
+    """
+    Configure root logging with the application's file and console handlers.
+    Log records are queued and written by a background listener thread, so
+    logging calls never block on file or console I/O.
+    Nothing is configured on import; callers that install their own handlers
+    first are left alone, since this does nothing if the root logger already
+    has handlers.
+
+    Args:
+        level: Root logger level
+        file: Log file path, or None to log to the console only
+    """
+    if logging.getLogger().handlers:
+        return
+
+    formatter = logging.Formatter(config.LOG_FORMAT)
+    handlers = []
+    if file is not None:
+        # delay=True: the file is only opened once something is logged
+        file_handler = logging.FileHandler(file, delay=True)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
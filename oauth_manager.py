@@ -3,36 +3,93 @@ OAuth 2.0 Authentication Manager for YouTube API.
 Handles authentication flow, token persistence, and automatic token refresh.
 """
 
+import base64
+import functools
 import json
 import logging
 import os
-from pathlib import Path
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
 from cryptography.fernet import Fernet
-from google.auth.transport.requests import Request
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 import config
 
-# Configure logging
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Seconds before expiry at which the background timer refreshes the token
+_PROACTIVE_REFRESH_LEAD = 120
+
+# Safety margin before expiry for the is_authenticated() fast path; larger
+# than google-auth's own refresh threshold so both agree on validity
+_VALIDITY_MARGIN_NS = 300 * 1_000_000_000
+
+# Stored token format: version byte + 12-byte nonce + AES-GCM ciphertext.
+# Older token files are plain Fernet tokens, which never start with this byte.
+_TOKEN_FORMAT_AESGCM = b'\x02'
+_AESGCM_NONCE_SIZE = 12
+
+# Flags for writing key/token files; O_CLOEXEC keeps them out of child processes
+_SECRET_FILE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+)
+
 
 class AuthenticationError(Exception):
     """Custom exception for authentication errors."""
     pass
 
 
+def _write_secret_file(path, data: bytes) -> None:
+    """
+    Write data to a file readable and writable only by its owner.
+    New files are created with mode 0600, so they are never briefly
+    readable under the default umask.
+    
+    Args:
+        path: File path
+        data: Bytes to write
+    """
+    fd = os.open(path, _SECRET_FILE_FLAGS, 0o600)
+    try:
+        if hasattr(os, 'fchmod'):
+            # The creation mode doesn't apply to files that already exist
+            os.fchmod(fd, 0o600)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_encryption_key() -> bytes:
+    """
+    Get or create encryption key for token storage.
+    The key never changes once created, so it is read from disk once per process.
+    
+    Returns:
+        Fernet-format (URL-safe base64) key
+    """
+    key_file = config.OAUTH_ENCRYPTION_KEY_FILE
+    
+    if os.path.exists(key_file):
+        with open(key_file, 'rb') as f:
+            key = f.read()
+    else:
+        key = Fernet.generate_key()
+        _write_secret_file(key_file, key)
+    
+    return key
+
+
 class OAuthManager:
     """
     Manages OAuth 2.0 authentication for YouTube API.
@@ -49,42 +106,68 @@ class OAuthManager:
         """
         self.client_id = client_id
         self.client_secret = client_secret
+        # OAuth client configuration for InstalledAppFlow (fixed per instance)
+        self._client_config = {
+            'installed': {
+                'client_id': client_id,
+                'client_secret': client_secret,
+                'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
+                'token_uri': 'https://oauth2.googleapis.com/token',
+                'redirect_uris': [config.OAUTH_REDIRECT_URI]
+            }
+        }
         self.credentials: Optional[Credentials] = None
-        self.fernet = self._get_encryption_key()
+        key = _load_encryption_key()
+        self.fernet = Fernet(key)  # Only used to read tokens saved in the old format
+        self.aead = AESGCM(self._derive_aead_key(key))
+        self._refresh_lock = threading.Lock()
+        self._transport_request = None  # google.auth Request, created on first refresh
+        self._timer_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_timer_expiry: Optional[datetime] = None
+        # Wall-clock time (ns) until which the current credentials are known valid
+        self._valid_until_ns = 0
+        # Last credentials loaded from disk, keyed by the token file's mtime
+        self._cached_mtime: Optional[int] = None
+        self._cached_credentials: Optional[Credentials] = None
         
-    def _get_encryption_key(self) -> Fernet:
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """
+        Expiry time (naive UTC) of the current access token, if known.
         """
-        Get or create encryption key for token storage.
+        return self.credentials.expiry if self.credentials else None
+    
+    @staticmethod
+    def _derive_aead_key(key: bytes) -> bytes:
+        """
+        Derive the AES-256-GCM token key from the stored key file contents.
         
+        Args:
+            key: Fernet-format key from the key file
+            
         Returns:
-            Fernet instance for encryption/decryption
+            32-byte AES key
         """
-        key_file = config.OAUTH_ENCRYPTION_KEY_FILE
-        
-        if key_file.exists():
-            with open(key_file, 'rb') as f:
-                key = f.read()
-        else:
-            key = Fernet.generate_key()
-            with open(key_file, 'wb') as f:
-                f.write(key)
-            # Set file permissions to read/write only by owner
-            os.chmod(key_file, 0o600)
-        
-        return Fernet(key)
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'youtube-uploader token aes-gcm'
+        ).derive(base64.urlsafe_b64decode(key))
     
-    def _encrypt_token(self, token_data: dict) -> bytes:
+    def _encrypt_token(self, token_json: str) -> bytes:
         """
         Encrypt token data.
         
         Args:
-            token_data: Token dictionary to encrypt
+            token_json: Token data serialized as JSON
             
         Returns:
             Encrypted bytes
         """
-        token_json = json.dumps(token_data)
-        return self.fernet.encrypt(token_json.encode())
+        nonce = os.urandom(_AESGCM_NONCE_SIZE)
+        return _TOKEN_FORMAT_AESGCM + nonce + self.aead.encrypt(nonce, token_json.encode(), None)
     
     def _decrypt_token(self, encrypted_data: bytes) -> dict:
         """
@@ -96,8 +179,15 @@ class OAuthManager:
         Returns:
             Decrypted token dictionary
         """
-        decrypted = self.fernet.decrypt(encrypted_data)
-        return json.loads(decrypted.decode())
+        if encrypted_data[:1] == _TOKEN_FORMAT_AESGCM:
+            nonce_end = 1 + _AESGCM_NONCE_SIZE
+            data = memoryview(encrypted_data)
+            decrypted = self.aead.decrypt(data[1:nonce_end], data[nonce_end:], None)
+        else:
+            # Token saved before the switch to AES-GCM
+            decrypted = self.fernet.decrypt(encrypted_data)
+        # json accepts UTF-8 bytes directly; no intermediate str
+        return json.loads(decrypted)
     
     def _save_credentials(self, credentials: Credentials) -> None:
         """
@@ -106,23 +196,10 @@ class OAuthManager:
         Args:
             credentials: Google OAuth credentials
         """
-        token_data = {
-            'token': credentials.token,
-            'refresh_token': credentials.refresh_token,
-            'token_uri': credentials.token_uri,
-            'client_id': credentials.client_id,
-            'client_secret': credentials.client_secret,
-            'scopes': credentials.scopes,
-            'expiry': credentials.expiry.isoformat() if credentials.expiry else None
-        }
-        
-        encrypted_data = self._encrypt_token(token_data)
+        encrypted_data = self._encrypt_token(credentials.to_json())
+        self._cached_mtime = None
         
-        with open(config.OAUTH_TOKEN_FILE, 'wb') as f:
-            f.write(encrypted_data)
-        
-        # Set file permissions to read/write only by owner
-        os.chmod(config.OAUTH_TOKEN_FILE, 0o600)
+        _write_secret_file(config.OAUTH_TOKEN_FILE, encrypted_data)
         
         logger.info("Credentials saved successfully")
     
@@ -130,31 +207,28 @@ class OAuthManager:
         """
         Load credentials from encrypted file.
         
+        Reuses the previously loaded credentials while the file is unchanged.
+        
         Returns:
             Credentials object or None if not found
         """
-        if not config.OAUTH_TOKEN_FILE.exists():
+        try:
+            mtime = os.stat(config.OAUTH_TOKEN_FILE).st_mtime_ns
+        except OSError:
             return None
         
+        if mtime == self._cached_mtime:
+            return self._cached_credentials
+        
         try:
             with open(config.OAUTH_TOKEN_FILE, 'rb') as f:
                 encrypted_data = f.read()
             
             token_data = self._decrypt_token(encrypted_data)
+            credentials = Credentials.from_authorized_user_info(token_data)
             
-            credentials = Credentials(
-                token=token_data['token'],
-                refresh_token=token_data['refresh_token'],
-                token_uri=token_data['token_uri'],
-                client_id=token_data['client_id'],
-                client_secret=token_data['client_secret'],
-                scopes=token_data['scopes']
-            )
-            
-            if token_data['expiry']:
-                from datetime import datetime
-                credentials.expiry = datetime.fromisoformat(token_data['expiry'])
-            
+            self._cached_mtime = mtime
+            self._cached_credentials = credentials
             logger.info("Credentials loaded successfully")
             return credentials
             
@@ -162,23 +236,133 @@ class OAuthManager:
             logger.error(f"Error loading credentials: {str(e)}")
             return None
     
-    def _refresh_credentials(self, credentials: Credentials) -> Credentials:
+    @staticmethod
+    def _needs_refresh(credentials: Credentials, skew: float = 0) -> bool:
+        """
+        Check whether credentials expire within the given number of seconds.
+        
+        Args:
+            credentials: Credentials to check
+            skew: Seconds of remaining lifetime required
+            
+        Returns:
+            True if the token is missing, expired or expires within skew seconds
+        """
+        if not credentials.token or credentials.expired:
+            return True
+        if credentials.expiry is None:
+            return False
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (credentials.expiry - now).total_seconds() <= skew
+    
+    def _set_credentials(self, credentials: Credentials) -> None:
+        """
+        Make credentials current and schedule their proactive refresh.
+        
+        Args:
+            credentials: Google OAuth credentials
+        """
+        self.credentials = credentials
+        if credentials.expiry is not None:
+            expiry_ns = int(credentials.expiry.replace(tzinfo=timezone.utc).timestamp() * 1e9)
+            self._valid_until_ns = expiry_ns - _VALIDITY_MARGIN_NS
+        else:
+            self._valid_until_ns = 0
+        
+        if credentials.expiry is None or not credentials.refresh_token:
+            return
+        
+        with self._timer_lock:
+            if self._refresh_timer is not None:
+                if self._refresh_timer_expiry == credentials.expiry:
+                    return
+                self._refresh_timer.cancel()
+            
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            expires_in = (credentials.expiry - now).total_seconds()
+            timer = threading.Timer(
+                max(expires_in - _PROACTIVE_REFRESH_LEAD, 0),
+                self._proactive_refresh
+            )
+            timer.daemon = True
+            timer.start()
+            self._refresh_timer = timer
+            self._refresh_timer_expiry = credentials.expiry
+    
+    def _proactive_refresh(self) -> None:
         """
-        Refresh expired credentials.
+        Timer callback that refreshes the token shortly before it expires.
+        """
+        with self._timer_lock:
+            self._refresh_timer = None
+            self._refresh_timer_expiry = None
+        
+        try:
+            self.ensure_fresh(skew=_PROACTIVE_REFRESH_LEAD)
+        except AuthenticationError as e:
+            logger.warning("Proactive token refresh failed: %s", e)
+    
+    def _refresh_credentials(self, credentials: Credentials, skew: float = 0) -> Credentials:
+        """
+        Refresh expired credentials and persist the result.
+        Refreshes are serialized; a caller that waited on another thread's
+        refresh reuses its result instead of spending the refresh token again.
         
         Args:
             credentials: Expired credentials
+            skew: Seconds of remaining lifetime that make a refresh unnecessary
             
         Returns:
             Refreshed credentials
         """
-        try:
-            credentials.refresh(Request())
-            logger.info("Credentials refreshed successfully")
+        with self._refresh_lock:
+            for current in (self.credentials, credentials):
+                if current is not None and not self._needs_refresh(current, skew):
+                    return current
+            
+            # Created on first refresh and reused, so the token endpoint
+            # connection stays in the session's pool between refreshes
+            if self._transport_request is None:
+                import requests
+                from google.auth.transport.requests import Request
+                self._transport_request = Request(session=requests.Session())
+            
+            try:
+                credentials.refresh(self._transport_request)
+                logger.info("Credentials refreshed successfully")
+            except Exception as e:
+                logger.error(f"Error refreshing credentials: {str(e)}")
+                raise AuthenticationError(f"Failed to refresh credentials: {str(e)}")
+            
+            self._save_credentials(credentials)
+            self._set_credentials(credentials)
             return credentials
-        except Exception as e:
-            logger.error(f"Error refreshing credentials: {str(e)}")
-            raise AuthenticationError(f"Failed to refresh credentials: {str(e)}")
+    
+    def ensure_fresh(self, skew: float = 60) -> Optional[Credentials]:
+        """
+        Refresh the access token if it expires within skew seconds.
+        
+        Args:
+            skew: Seconds of remaining lifetime required
+            
+        Returns:
+            Credentials object or None if not authenticated
+            
+        Raises:
+            AuthenticationError: If the refresh fails
+        """
+        credentials = self.credentials or self._load_credentials()
+        if credentials is None:
+            return None
+        
+        if not self._needs_refresh(credentials, skew):
+            self._set_credentials(credentials)
+            return credentials
+        
+        if not credentials.refresh_token:
+            return None
+        
+        return self._refresh_credentials(credentials, skew)
     
     def authenticate(self) -> Credentials:
         """
@@ -196,34 +380,23 @@ class OAuthManager:
         
         if credentials and credentials.valid:
             logger.info("Using existing valid credentials")
-            self.credentials = credentials
+            self._set_credentials(credentials)
             return credentials
         
         if credentials and credentials.expired and credentials.refresh_token:
             logger.info("Refreshing expired credentials")
-            credentials = self._refresh_credentials(credentials)
-            self._save_credentials(credentials)
-            self.credentials = credentials
-            return credentials
+            return self._refresh_credentials(credentials)
         
         # Need to perform new OAuth flow
         logger.info("Initiating new OAuth flow")
         
         try:
-            # Create OAuth flow configuration
-            client_config = {
-                'installed': {
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret,
-                    'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
-                    'token_uri': 'https://oauth2.googleapis.com/token',
-                    'redirect_uris': [config.OAUTH_REDIRECT_URI]
-                }
-            }
+            # Imported here: the OAuth flow stack is only needed for new logins
+            from google_auth_oauthlib.flow import InstalledAppFlow
             
             # Create flow
             flow = InstalledAppFlow.from_client_config(
-                client_config,
+                self._client_config,
                 scopes=config.OAUTH_SCOPES
             )
             
@@ -236,7 +409,7 @@ class OAuthManager:
             
             # Save credentials
             self._save_credentials(credentials)
-            self.credentials = credentials
+            self._set_credentials(credentials)
             
             logger.info("Authentication successful")
             return credentials
@@ -259,14 +432,11 @@ class OAuthManager:
         credentials = self._load_credentials()
         if credentials:
             if credentials.valid:
-                self.credentials = credentials
+                self._set_credentials(credentials)
                 return credentials
             elif credentials.expired and credentials.refresh_token:
                 try:
-                    credentials = self._refresh_credentials(credentials)
-                    self._save_credentials(credentials)
-                    self.credentials = credentials
-                    return credentials
+                    return self._refresh_credentials(credentials)
                 except Exception:
                     pass
         
@@ -279,6 +449,10 @@ class OAuthManager:
         Returns:
             True if authenticated, False otherwise
         """
+        # Fast path: skip the expiry computation while well before expiry
+        if self.credentials is not None and time.time_ns() < self._valid_until_ns:
+            return True
+        
         credentials = self.get_credentials()
         return credentials is not None and credentials.valid
     
@@ -286,9 +460,21 @@ class OAuthManager:
         """
         Clear stored credentials.
         """
-        if config.OAUTH_TOKEN_FILE.exists():
-            config.OAUTH_TOKEN_FILE.unlink()
+        try:
+            os.remove(config.OAUTH_TOKEN_FILE)
             logger.info("Credentials cleared")
+        except FileNotFoundError:
+            pass
+        
+        self._cached_mtime = None
+        self._cached_credentials = None
+        self._valid_until_ns = 0
+        
+        with self._timer_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = None
+            self._refresh_timer_expiry = None
         
         self.credentials = None
     
@@ -300,18 +486,10 @@ class OAuthManager:
         Returns:
             Authorization URL
         """
-        client_config = {
-            'installed': {
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-                'auth_uri': 'https://accounts.google.com/o/oauth2/auth',
-                'token_uri': 'https://oauth2.googleapis.com/token',
-                'redirect_uris': [config.OAUTH_REDIRECT_URI]
-            }
-        }
+        from google_auth_oauthlib.flow import InstalledAppFlow
         
         flow = InstalledAppFlow.from_client_config(
-            client_config,
+            self._client_config,
             scopes=config.OAUTH_SCOPES
         )
         
@@ -0,0 +1,49 @@
+"""
+Compile the .env file into data/env_compiled.py.
+
+config.py imports the compiled module instead of parsing .env on every
+start, as long as it is newer than .env. Re-run after editing .env:
+
+    python scripts/compile_env.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ENV_FILE = BASE_DIR / ".env"
+OUTPUT_FILE = BASE_DIR / "data" / "env_compiled.py"
+
+
+def main() -> int:
+    """Write the compiled environment module."""
+    if not ENV_FILE.exists():
+        print(f"No .env file found at {ENV_FILE}", file=sys.stderr)
+        return 1
+
+    lines = [
+        '"""Generated by scripts/compile_env.py from .env - do not edit."""',
+        "",
+        "import os",
+        "",
+    ]
+    # setdefault matches load_dotenv(): real environment variables win
+    for key, value in dotenv_values(ENV_FILE).items():
+        if value is not None:
+            lines.append(f"os.environ.setdefault({key!r}, {value!r})")
+
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # The output holds secrets, so create it readable by the owner only
+    fd = os.open(OUTPUT_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print(f"Wrote {len(lines) - 4} variables to {OUTPUT_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,34 +3,209 @@ YouTube API Client Wrapper.
 Handles video uploads, metadata management, and progress tracking.
 """
 
+import ctypes
+import errno
+import functools
+import json
 import logging
+import mimetypes
+import mmap
 import os
+import random
+import stat
+import sys
 import time
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from googleapiclient.http import DEFAULT_CHUNK_SIZE, MediaInMemoryUpload, MediaIoBaseUpload
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
+import google_auth_httplib2
 import httplib2
+import requests
+from requests.adapters import HTTPAdapter
 import io
 import threading
 import time
 
 import config
 
-# Configure logging
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Lower-cased, interned suffixes for O(1) format checks
+_SUPPORTED_VIDEO_SUFFIXES = frozenset(
+    sys.intern(suffix.lower()) for suffix in config.SUPPORTED_VIDEO_FORMATS
+)
+_THUMBNAIL_MIME_TYPES = MappingProxyType({
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp'
+})
+
+# Recording dates may arrive as ISO 8601 strings
+_parse_iso = datetime.fromisoformat
+
+# API error reasons mapped to the error types reported by _parse_http_error
+_REASON_TO_ERROR_TYPE = MappingProxyType({
+    'quotaExceeded': 'quota_exceeded',
+    'forbidden': 'forbidden',
+    'invalidCredentials': 'authentication'
+})
+
+# Base URL for direct REST calls to the YouTube Data API
+_API_BASE_URL = 'https://www.googleapis.com/youtube/v3/'
+
+# Server errors worth an immediate first retry, and the delay used for it
+_TRANSIENT_SERVER_STATUSES = frozenset({500, 502, 503, 504})
+_FAST_RETRY_DELAY = 0.2
+
+# Minimum seconds between progress callbacks during an upload
+_PROGRESS_REPORT_INTERVAL = 0.25
+
+# How long read-only API results are reused, in seconds
+_CATEGORY_CACHE_TTL = 3600
+_CHANNEL_CACHE_TTL = 60
+
+# Upload request defaults, and the metadata keys that override snippet fields
+_DEFAULT_SNIPPET = MappingProxyType({
+    'title': 'Untitled',
+    'description': '',
+    'tags': (),
+    'categoryId': '22'  # People & Blogs
+})
+_DEFAULT_STATUS = MappingProxyType({
+    'privacyStatus': 'private',
+    'selfDeclaredMadeForKids': False
+})
+_SNIPPET_FIELDS = MappingProxyType({
+    'title': 'title',
+    'description': 'description',
+    'tags': 'tags',
+    'category': 'categoryId'
+})
+
+# Language names offered in the UI mapped to ISO 639-1 codes
+_LANGUAGE_MAP = MappingProxyType({
+    'English': 'en',
+    'Thai': 'th',
+    'Spanish': 'es',
+    'French': 'fr',
+    'German': 'de',
+    'Japanese': 'ja',
+    'Korean': 'ko',
+    'Chinese': 'zh',
+    'Other': 'en'
+})
+
+
+# statx() constants from <linux/stat.h> and <fcntl.h>
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MODE = 0x0002
+_STATX_UID = 0x0008
+_STATX_SIZE = 0x0200
+# Offsets of the fields we read within struct statx (256 bytes in total)
+_STATX_BUF_SIZE = 256
+_STATX_UID_OFFSET = 20
+_STATX_MODE_OFFSET = 28
+_STATX_SIZE_OFFSET = 40
+
+# None until the first _fast_stat() call works out whether statx() is usable
+_HAS_STATX: Optional[bool] = None
+_statx = None
+
+_FileStat = namedtuple('_FileStat', ['st_mode', 'st_uid', 'st_size'])
+
+
+def _init_statx() -> bool:
+    """Look up statx() in libc; available on Linux with glibc 2.28+."""
+    global _statx
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.statx
+    except (OSError, AttributeError):
+        return False
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                     ctypes.c_uint, ctypes.c_void_p]
+    func.restype = ctypes.c_int
+    _statx = func
+    return True
+
+
+def _fast_stat(file_path: str) -> _FileStat:
+    """
+    Stat a file, fetching only its type, mode, owner and size.
+    Uses statx() with AT_STATX_DONT_SYNC on Linux so network filesystems
+    can answer from cached attributes; falls back to os.stat() elsewhere.
+    
+    Raises:
+        OSError: If the file cannot be stat'ed (FileNotFoundError if missing)
+    """
+    global _HAS_STATX
+    if _HAS_STATX is None:
+        _HAS_STATX = _init_statx()
+    
+    if _HAS_STATX:
+        buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+        result = _statx(
+            _AT_FDCWD, os.fsencode(file_path), _AT_STATX_DONT_SYNC,
+            _STATX_TYPE | _STATX_MODE | _STATX_UID | _STATX_SIZE, buf
+        )
+        if result == 0:
+            return _FileStat(
+                int.from_bytes(buf.raw[_STATX_MODE_OFFSET:_STATX_MODE_OFFSET + 2], sys.byteorder),
+                int.from_bytes(buf.raw[_STATX_UID_OFFSET:_STATX_UID_OFFSET + 4], sys.byteorder),
+                int.from_bytes(buf.raw[_STATX_SIZE_OFFSET:_STATX_SIZE_OFFSET + 8], sys.byteorder)
+            )
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EPERM):
+            raise OSError(err, os.strerror(err), file_path)
+        # Kernel or seccomp policy rejects statx(); stop trying
+        _HAS_STATX = False
+    
+    st = os.stat(file_path)
+    return _FileStat(st.st_mode, st.st_uid, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _discovery_document() -> Optional[str]:
+    """
+    Return the YouTube discovery document bundled with googleapiclient.
+    Read once per process; returned as a string because building a service
+    modifies the parsed document. None if the package has no bundled copy.
+    """
+    return discovery_cache.get_static_doc(
+        config.YOUTUBE_API_SERVICE_NAME,
+        config.YOUTUBE_API_VERSION
+    )
+
+
+def _is_readable(file_path: str, st: _FileStat) -> bool:
+    """
+    Check read permission using an existing stat result.
+    Only falls back to an access() syscall when the permission bits alone
+    are not conclusive for the current user.
+    """
+    if hasattr(os, 'geteuid'):
+        euid = os.geteuid()
+        if euid == st.st_uid and st.st_mode & stat.S_IRUSR:
+            return True
+        if euid != 0 and not st.st_mode & (stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH):
+            return False
+    return os.access(file_path, os.R_OK)
+
 
 class YouTubeClientError(Exception):
     """Base exception for YouTube client errors."""
@@ -57,12 +232,14 @@ class UploadError(YouTubeClientError):
     pass
 
 
-class ThrottledMediaFileUpload(MediaFileUpload):
+class ThrottledMediaFileUpload(MediaIoBaseUpload):
     """
-    A MediaFileUpload subclass that implements bandwidth throttling.
+    A file upload with bandwidth throttling, streamed from a read-only
+    memory map so chunks are sliced from the page cache rather than copied
+    through an intermediate read buffer.
     """
     
-    def __init__(self, filename, chunksize=None, resumable=False, bandwidth_limit=0):
+    def __init__(self, filename, chunksize=DEFAULT_CHUNK_SIZE, resumable=False, bandwidth_limit=0):
         """
         Initialize throttled media upload.
         
@@ -72,7 +249,22 @@ class ThrottledMediaFileUpload(MediaFileUpload):
             resumable: Whether to use resumable upload
             bandwidth_limit: Maximum bytes per second (0 = unlimited)
         """
-        super().__init__(filename, chunksize=chunksize, resumable=resumable)
+        fd = os.open(filename, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            if os.fstat(fd).st_size:
+                stream = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                # Uploads read front to back; let the kernel read ahead
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    stream.madvise(mmap.MADV_SEQUENTIAL)
+            else:
+                # Empty files cannot be mapped
+                stream = io.BytesIO()
+        finally:
+            # The mapping keeps its own reference to the file
+            os.close(fd)
+        
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        super().__init__(stream, mimetype, chunksize=chunksize, resumable=resumable)
         self.bandwidth_limit = bandwidth_limit
         self.last_chunk_time = 0
         self.lock = threading.Lock()
@@ -104,6 +296,10 @@ class ThrottledMediaFileUpload(MediaFileUpload):
         
         # Call parent method
         return super().next_chunk(http)
+    
+    def close(self) -> None:
+        """Release the memory map backing this upload."""
+        self._fd.close()
 
 
 class YouTubeClient:
@@ -121,18 +317,40 @@ class YouTubeClient:
         """
         self.credentials = credentials
         self.youtube = None
+        self._http = None
+        self._session = None
+        # (ETag, decoded body) of the last response per REST query
+        self._etags: Dict[Tuple[str, tuple], Tuple[str, Dict[str, any]]] = {}
+        # (monotonic timestamp, result) of the last successful lookups
+        self._category_cache: Optional[Tuple[float, Dict[str, str]]] = None
+        self._channel_cache: Optional[Tuple[float, Dict[str, any]]] = None
         self._initialize_service()
     
     def _initialize_service(self) -> None:
         """Initialize YouTube API service with optimized settings."""
         try:
-            # Build the YouTube service with credentials
-            # The Google API client will handle HTTP optimization internally
-            self.youtube = build(
-                config.YOUTUBE_API_SERVICE_NAME,
-                config.YOUTUBE_API_VERSION,
-                credentials=self.credentials
+            # One authorized keep-alive connection pool shared by every call
+            # made through this service, with the configured socket timeout
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials,
+                http=httplib2.Http(timeout=config.UPLOAD_CONNECTION_TIMEOUT)
             )
+            self._http = http.http
+            document = _discovery_document()
+            if document is not None:
+                self.youtube = build_from_document(document, http=http)
+            else:
+                self.youtube = build(
+                    config.YOUTUBE_API_SERVICE_NAME,
+                    config.YOUTUBE_API_VERSION,
+                    http=http
+                )
+            
+            # Read-only metadata calls go straight to the REST API over a
+            # pooled requests session; uploads keep the discovery client
+            self._session = AuthorizedSession(self.credentials)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+            self._session.mount('https://', adapter)
             logger.info("YouTube API service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize YouTube service: {str(e)}")
@@ -153,23 +371,26 @@ class YouTubeClient:
         """
         path = Path(file_path)
         
-        # Check if file exists
-        if not path.exists():
+        # A single stat() gives existence, file type and size
+        try:
+            st = _fast_stat(file_path)
+        except FileNotFoundError:
             raise FileValidationError(f"File not found: {file_path}")
         
         # Check if it's a file (not directory)
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise FileValidationError(f"Path is not a file: {file_path}")
         
         # Check file extension
-        if path.suffix.lower() not in config.SUPPORTED_VIDEO_FORMATS:
+        suffix = path.suffix.lower()
+        if suffix not in _SUPPORTED_VIDEO_SUFFIXES:
             raise FileValidationError(
                 f"Unsupported file format: {path.suffix}. "
-                f"Supported formats: {', '.join(config.SUPPORTED_VIDEO_FORMATS)}"
+                f"Supported formats: {', '.join(config.SUPPORTED_VIDEO_FORMATS_DISPLAY)}"
             )
         
         # Check file size
-        file_size = path.stat().st_size
+        file_size = st.st_size
         if file_size > config.MAX_FILE_SIZE:
             raise FileValidationError(
                 f"File size ({file_size / (1024**3):.2f} GB) exceeds "
@@ -177,7 +398,7 @@ class YouTubeClient:
             )
         
         # Check if file is readable
-        if not os.access(file_path, os.R_OK):
+        if not _is_readable(file_path, st):
             raise FileValidationError(f"File is not readable: {file_path}")
         
         logger.info(f"File validated successfully: {file_path}")
@@ -187,14 +408,16 @@ class YouTubeClient:
             'file_path': str(path.absolute()),
             'file_name': path.name,
             'file_size': file_size,
-            'file_extension': path.suffix.lower()
+            'file_extension': suffix
         }
     
     def upload_video(
         self,
         file_path: str,
         metadata: Dict[str, any],
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        chunk_size: Optional[int] = None,
+        file_info: Optional[Dict[str, any]] = None
     ) -> Dict[str, any]:
         """
         Upload video to YouTube with progress tracking.
@@ -204,43 +427,60 @@ class YouTubeClient:
             metadata: Video metadata (title, description, tags, category, privacy_status, thumbnail)
             progress_callback: Optional callback function for progress updates
                               Callback receives (bytes_uploaded, total_bytes)
+            chunk_size: Resumable upload chunk size in bytes, a multiple of
+                        256 KiB, or -1 to send the whole file in a single
+                        request (defaults to config.UPLOAD_CHUNK_SIZE)
+            file_info: Result of an earlier validate_video_file() call for
+                       this file; when given, validation is skipped and its
+                       file size is trusted
         
         Returns:
             Dictionary with upload results including video ID
             
         Raises:
+            ValueError: If chunk_size is not a multiple of 256 KiB or -1
             FileValidationError: If file validation fails
             QuotaExceededError: If API quota is exceeded
             NetworkError: If network error occurs
             UploadError: If upload fails
         """
-        # Validate file
-        file_info = self.validate_video_file(file_path)
-        
-        # Prepare video metadata
-        body = {
-            'snippet': {
-                'title': metadata.get('title', 'Untitled'),
-                'description': metadata.get('description', ''),
-                'tags': metadata.get('tags', []),
-                'categoryId': metadata.get('category', '22'),  # Default: People & Blogs
-                'defaultAudioLanguage': self._get_language_code(metadata.get('video_language', 'English'))
-            },
-            'status': {
-                'privacyStatus': metadata.get('privacy_status', 'private'),
-                'selfDeclaredMadeForKids': False
-            }
-        }
+        if chunk_size is None:
+            chunk_size = config.UPLOAD_CHUNK_SIZE
+        if chunk_size != -1 and (chunk_size <= 0 or chunk_size % config.UPLOAD_CHUNK_ALIGNMENT):
+            raise ValueError(
+                f"chunk_size must be a positive multiple of {config.UPLOAD_CHUNK_ALIGNMENT} bytes or -1, "
+                f"got {chunk_size}"
+            )
+        
+        # The timeout setting may have changed since this client was built
+        self._apply_timeout(config.UPLOAD_CONNECTION_TIMEOUT)
+        
+        # Validate file unless the caller already has
+        if file_info is None:
+            file_info = self.validate_video_file(file_path)
+        
+        # Prepare video metadata: defaults overlaid with whatever was supplied
+        snippet = {**_DEFAULT_SNIPPET}
+        for key in _SNIPPET_FIELDS.keys() & metadata.keys():
+            snippet[_SNIPPET_FIELDS[key]] = metadata[key]
+        snippet['defaultAudioLanguage'] = _LANGUAGE_MAP.get(metadata.get('video_language', 'English'), 'en')
+        status = {**_DEFAULT_STATUS}
+        if 'privacy_status' in metadata:
+            status['privacyStatus'] = metadata['privacy_status']
+        title = snippet['title']
+        
+        part = 'snippet,status'
+        body = {'snippet': snippet, 'status': status}
         
         # Add recording details if recording date is provided
-        if metadata.get('recording_date'):
-            from datetime import datetime
-            recording_date = metadata['recording_date']
+        recording_date = metadata.get('recording_date')
+        if recording_date:
             if isinstance(recording_date, str):
-                recording_date = datetime.fromisoformat(recording_date)
+                recording_date = _parse_iso(recording_date)
             body['recordingDetails'] = {
                 'recordingDate': recording_date.isoformat()
             }
+            part += ',recordingDetails'
         
         # Log altered content and paid promotion info (these cannot be set via API during upload)
         altered_content = metadata.get('altered_content', 'No')
@@ -252,10 +492,11 @@ class YouTubeClient:
         logger.info(f"Starting upload: {file_info['file_name']}")
         
         # Handle thumbnail upload
-        thumbnail_path = metadata.get('thumbnail')
-        if thumbnail_path:
-            logger.info(f"Thumbnail provided: {thumbnail_path}")
+        thumbnail = metadata.get('thumbnail')
+        if thumbnail:
+            logger.info(f"Thumbnail provided: {getattr(thumbnail, 'name', thumbnail)}")
         
+        media = None
         try:
             # Determine if we should use resumable upload based on file size
             file_size = file_info['file_size']
@@ -264,37 +505,41 @@ class YouTubeClient:
             # Create throttled media upload object with optimized chunk size
             media = ThrottledMediaFileUpload(
                 file_path,
-                chunksize=config.UPLOAD_CHUNK_SIZE,
+                chunksize=chunk_size,
                 resumable=use_resumable,
                 bandwidth_limit=config.UPLOAD_BANDWIDTH_LIMIT
             )
             
             # Initialize upload request
             request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
+                part=part,
                 body=body,
                 media_body=media
             )
             
-            logger.info(f"Starting upload with {config.UPLOAD_CHUNK_SIZE / (1024**2):.0f}MB chunks, resumable: {use_resumable}")
+            if chunk_size == -1:
+                logger.info(f"Starting single-request upload, resumable: {use_resumable}")
+            else:
+                logger.info(f"Starting upload with {chunk_size / (1024**2):.0f}MB chunks, resumable: {use_resumable}")
             
             # Execute upload with retry logic
             response = self._execute_upload_with_retry(
                 request,
                 media,
                 progress_callback,
-                file_info['file_size']
+                file_size
             )
             
             video_id = response.get('id', '')
             
             logger.info(f"Upload successful: Video ID = {video_id}")
+            # The channel's video count has changed
+            self._channel_cache = None
             
             # Upload thumbnail if provided
-            thumbnail_path = metadata.get('thumbnail')
-            if thumbnail_path:
+            if thumbnail:
                 try:
-                    self._upload_thumbnail(video_id, thumbnail_path)
+                    self._upload_thumbnail(video_id, thumbnail)
                     logger.info(f"Thumbnail uploaded successfully for video {video_id}")
                 except Exception as e:
                     logger.warning(f"Failed to upload thumbnail: {str(e)}. Video uploaded without thumbnail.")
@@ -303,8 +548,8 @@ class YouTubeClient:
                 'success': True,
                 'video_id': video_id,
                 'video_url': f"https://www.youtube.com/watch?v={video_id}",
-                'title': metadata.get('title', 'Untitled'),
-                'file_size': file_info['file_size']
+                'title': title,
+                'file_size': file_size
             }
             
         except HttpError as e:
@@ -323,6 +568,103 @@ class YouTubeClient:
         except Exception as e:
             logger.error(f"Unexpected error during upload: {str(e)}")
             raise UploadError(f"Upload failed: {str(e)}")
+        
+        finally:
+            if media is not None:
+                media.close()
+    
+    def _apply_timeout(self, timeout: float) -> None:
+        """
+        Set the socket timeout for the discovery client's connections.
+        
+        Args:
+            timeout: Timeout in seconds
+        """
+        self._http.timeout = timeout
+        # Pooled connections keep the timeout they were created with
+        for conn in self._http.connections.values():
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+    
+    def upload_videos_batch(
+        self,
+        uploads: List[Tuple[str, Dict[str, any]]],
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        worker_type: str = 'thread'
+    ) -> Iterator[Tuple[str, Dict[str, any]]]:
+        """
+        Upload several videos concurrently.
+        
+        Each worker thread gets its own YouTubeClient, since the API service
+        object is not thread-safe. With worker_type='process' each upload runs
+        in a separate process instead, which avoids contention on the GIL but
+        cannot report progress.
+        
+        Args:
+            uploads: List of (file_path, metadata) pairs
+            max_workers: Maximum number of concurrent uploads
+            progress_callback: Optional callback receiving
+                              (file_path, bytes_uploaded, total_bytes);
+                              called from worker threads
+            worker_type: 'thread' or 'process'
+        
+        Returns:
+            Iterator of (file_path, outcome) pairs in completion order, where
+            outcome is the upload_video result or the exception it raised
+        
+        Raises:
+            ValueError: If worker_type is unknown, or progress_callback is
+                        given with worker_type='process'
+        """
+        # Validate here rather than in the generator so bad arguments fail
+        # at the call instead of on the first iteration
+        if worker_type == 'thread':
+            executor_factory = functools.partial(
+                ThreadPoolExecutor,
+                max_workers=max_workers,
+                thread_name_prefix='youtube-upload'
+            )
+            local = threading.local()
+            
+            def upload(file_path, metadata):
+                client = getattr(local, 'client', None)
+                if client is None:
+                    client = local.client = YouTubeClient(self.credentials)
+                callback = None
+                if progress_callback:
+                    def callback(uploaded, total):
+                        progress_callback(file_path, uploaded, total)
+                return client.upload_video(file_path, metadata, callback)
+        elif worker_type == 'process':
+            if progress_callback:
+                raise ValueError("progress_callback is not supported with worker_type='process'")
+            executor_factory = functools.partial(ProcessPoolExecutor, max_workers=max_workers)
+            upload = functools.partial(_upload_in_process, self.credentials)
+        else:
+            raise ValueError(f"Unknown worker_type: {worker_type}")
+        
+        return self._run_batch(executor_factory, upload, uploads)
+    
+    @staticmethod
+    def _run_batch(
+        executor_factory: Callable[[], Executor],
+        upload: Callable[[str, Dict[str, any]], Dict[str, any]],
+        uploads: List[Tuple[str, Dict[str, any]]]
+    ) -> Iterator[Tuple[str, Dict[str, any]]]:
+        """Submit each upload to a new executor and yield outcomes as they complete."""
+        with executor_factory() as executor:
+            futures = {
+                executor.submit(upload, file_path, metadata): file_path
+                for file_path, metadata in uploads
+            }
+            for future in as_completed(futures):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                yield futures[future], outcome
     
     def _execute_upload_with_retry(
         self,
@@ -336,7 +678,7 @@ class YouTubeClient:
         
         Args:
             request: YouTube API upload request
-            media: MediaFileUpload object
+            media: ThrottledMediaFileUpload object
             progress_callback: Optional progress callback
             total_bytes: Total file size in bytes
             
@@ -350,24 +692,36 @@ class YouTubeClient:
         retry_count = 0
         last_exception = None
         consecutive_successes = 0
+        last_report = 0.0
+        
+        # Bind hot-loop lookups to locals once
+        next_chunk = request.next_chunk
+        monotonic = time.monotonic
+        debug = logger.debug
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         while retry_count < config.MAX_RETRY_ATTEMPTS:
             try:
                 response = None
                 while response is None:
-                    status, response = request.next_chunk()
+                    status, response = next_chunk()
                     
                     if status:
-                        # Update progress
+                        # Update progress, at most once per reporting interval
                         bytes_uploaded = status.resumable_progress
                         if progress_callback:
-                            progress_callback(bytes_uploaded, total_bytes)
+                            now = monotonic()
+                            if now - last_report >= _PROGRESS_REPORT_INTERVAL:
+                                last_report = now
+                                progress_callback(bytes_uploaded, total_bytes)
                         
-                        # Calculate upload speed
-                        progress_percent = bytes_uploaded / total_bytes * 100
-                        logger.debug(
-                            f"Upload progress: {progress_percent:.1f}% ({bytes_uploaded / (1024**2):.1f}MB / {total_bytes / (1024**2):.1f}MB)"
-                        )
+                        if debug_enabled:
+                            debug(
+                                "Upload progress: %.1f%% (%.1fMB / %.1fMB)",
+                                bytes_uploaded / total_bytes * 100,
+                                bytes_uploaded / (1024**2),
+                                total_bytes / (1024**2)
+                            )
                         
                         # Reset retry count on successful chunk
                         consecutive_successes += 1
@@ -375,9 +729,17 @@ class YouTubeClient:
                             retry_count = 0
                             consecutive_successes = 0
                 
+                # The final chunk, or a single-request upload, returns no status
+                if progress_callback:
+                    progress_callback(total_bytes, total_bytes)
+                
                 return response
             
             except Exception as e:
+                # An exhausted quota will not recover by retrying
+                if isinstance(e, HttpError) and self._parse_http_error(e)['error_type'] == 'quota_exceeded':
+                    raise
+                
                 last_exception = e
                 retry_count += 1
                 consecutive_successes = 0  # Reset on error
@@ -386,11 +748,7 @@ class YouTubeClient:
                     logger.error(f"Upload failed after {retry_count} attempts")
                     raise NetworkError(f"Upload failed after {retry_count} attempts: {str(e)}")
                 
-                # Calculate delay with exponential backoff (using optimized multiplier)
-                delay = min(
-                    config.RETRY_INITIAL_DELAY * (config.RETRY_BACKOFF_MULTIPLIER ** (retry_count - 1)),
-                    config.RETRY_MAX_DELAY
-                )
+                delay = self._retry_delay(e, retry_count)
                 
                 logger.warning(
                     f"Upload attempt {retry_count} failed. Retrying in {delay:.1f}s... Error: {str(e)}"
@@ -399,6 +757,34 @@ class YouTubeClient:
         
         raise NetworkError(f"Upload failed: {str(last_exception)}")
     
+    @staticmethod
+    def _retry_delay(error: Exception, retry_count: int) -> float:
+        """
+        Compute a jittered exponential backoff delay for a failed upload attempt.
+        
+        Server errors are retried almost immediately the first time, dropped
+        connections after half the backoff, and rate limiting and anything
+        else after the full backoff. Jitter keeps concurrent uploads from
+        retrying in lockstep.
+        
+        Args:
+            error: Exception raised by the failed attempt
+            retry_count: Number of failed attempts so far (1-based)
+            
+        Returns:
+            Delay in seconds
+        """
+        backoff = min(
+            config.RETRY_INITIAL_DELAY * (config.RETRY_BACKOFF_MULTIPLIER ** (retry_count - 1)),
+            config.RETRY_MAX_DELAY
+        )
+        if isinstance(error, HttpError):
+            if error.resp.status in _TRANSIENT_SERVER_STATUSES and retry_count == 1:
+                return _FAST_RETRY_DELAY
+        elif isinstance(error, (ConnectionError, TimeoutError, httplib2.HttpLib2Error)):
+            backoff /= 2
+        return backoff * random.uniform(0.5, 1.5)
+    
     def _get_language_code(self, language_name: str) -> str:
         """
         Convert language name to ISO 639-1 code.
@@ -409,18 +795,7 @@ class YouTubeClient:
         Returns:
             ISO 639-1 language code (e.g., "en", "th")
         """
-        language_map = {
-            'English': 'en',
-            'Thai': 'th',
-            'Spanish': 'es',
-            'French': 'fr',
-            'German': 'de',
-            'Japanese': 'ja',
-            'Korean': 'ko',
-            'Chinese': 'zh',
-            'Other': 'en'
-        }
-        return language_map.get(language_name, 'en')
+        return _LANGUAGE_MAP.get(language_name, 'en')
     
     def _parse_http_error(self, error: HttpError) -> Dict[str, str]:
         """
@@ -432,67 +807,67 @@ class YouTubeClient:
         Returns:
             Dictionary with error details
         """
-        error_details = {
-            'error_type': 'unknown',
-            'message': str(error)
-        }
-        
+        # error.error_details may hold the google.rpc "details" list, which
+        # has no legacy reason codes, so read the "errors" list directly
         try:
-            error_content = error.error_details[0] if error.error_details else {}
-            error_reason = error_content.get('reason', '')
-            
-            if error_reason == 'quotaExceeded':
-                error_details['error_type'] = 'quota_exceeded'
-            elif error_reason == 'forbidden':
-                error_details['error_type'] = 'forbidden'
-            elif error_reason == 'invalidCredentials':
-                error_details['error_type'] = 'authentication'
-            
-            error_details['message'] = error_content.get('message', str(error))
-            
+            error_content = json.loads(error.content)['error']['errors'][0]
         except Exception:
-            pass
+            error_content = {}
         
-        return error_details
+        return {
+            'error_type': _REASON_TO_ERROR_TYPE.get(error_content.get('reason', ''), 'unknown'),
+            'message': error_content.get('message') or str(error)
+        }
     
-    def _upload_thumbnail(self, video_id: str, thumbnail_path: str) -> None:
+    def _upload_thumbnail(self, video_id: str, thumbnail) -> None:
         """
         Upload a custom thumbnail for a video.
         
         Args:
             video_id: YouTube video ID
-            thumbnail_path: Path to thumbnail image file
+            thumbnail: Path to thumbnail image file, or a seekable binary
+                       file object with a name attribute (e.g. in-memory upload)
             
         Raises:
             UploadError: If thumbnail upload fails
         """
         try:
-            # Validate thumbnail file
-            path = Path(thumbnail_path)
-            if not path.exists():
-                raise UploadError(f"Thumbnail file not found: {thumbnail_path}")
+            in_memory = hasattr(thumbnail, 'read')
+            name = getattr(thumbnail, 'name', '') if in_memory else thumbnail
             
-            # Check file extension
-            if path.suffix.lower() not in ['.jpg', '.jpeg', '.png', '.webp']:
+            # Check file extension first; it needs no I/O
+            suffix = os.path.splitext(name)[1]
+            mimetype = _THUMBNAIL_MIME_TYPES.get(suffix.lower())
+            if mimetype is None:
                 raise UploadError(
-                    f"Unsupported thumbnail format: {path.suffix}. "
+                    f"Unsupported thumbnail format: {suffix}. "
                     f"Supported formats: JPG, JPEG, PNG, WEBP"
                 )
             
+            # One stat() gives both existence and size
+            if in_memory:
+                file_size = thumbnail.seek(0, io.SEEK_END)
+                thumbnail.seek(0)
+            else:
+                try:
+                    file_size = _fast_stat(thumbnail).st_size
+                except FileNotFoundError:
+                    raise UploadError(f"Thumbnail file not found: {thumbnail}")
+            
             # Check file size (YouTube limit: 2MB)
-            file_size = path.stat().st_size
             if file_size > 2 * 1024 * 1024:  # 2MB
                 raise UploadError(
                     f"Thumbnail size ({file_size / (1024**2):.2f} MB) exceeds "
                     f"YouTube's limit of 2 MB"
                 )
             
-            # Create media upload object for thumbnail
-            media = MediaFileUpload(
-                thumbnail_path,
-                mimetype='image/jpeg',  # YouTube accepts JPEG format
-                resumable=False
-            )
+            # Create media upload object for thumbnail; at 2 MB or less it
+            # is sent in a single request straight from memory
+            if in_memory:
+                media = MediaIoBaseUpload(thumbnail, mimetype=mimetype, resumable=False)
+            else:
+                with open(thumbnail, 'rb') as f:
+                    media = MediaInMemoryUpload(f.read(), mimetype=mimetype, resumable=False)
             
             # Set thumbnail
             self.youtube.thumbnails().set(
@@ -510,6 +885,42 @@ class YouTubeClient:
             logger.error(f"Error uploading thumbnail: {str(e)}")
             raise UploadError(f"Failed to upload thumbnail: {str(e)}")
     
+    def _api_get(self, resource: str, **params) -> Dict[str, any]:
+        """
+        Issue a GET request against the YouTube Data API.
+        
+        Args:
+            resource: API resource name (e.g. "channels")
+            **params: Query parameters
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        # Revalidate the previous response for this query with its ETag; an
+        # unchanged resource comes back as a body-less 304
+        key = (resource, tuple(sorted(params.items())))
+        cached = self._etags.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self._session.get(
+            _API_BASE_URL + resource,
+            params=params,
+            headers=headers,
+            timeout=config.UPLOAD_CONNECTION_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        data = response.json()
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[key] = (etag, data)
+        return data
+    
     def get_video_categories(self) -> Dict[str, str]:
         """
         Get available video categories from YouTube.
@@ -517,11 +928,12 @@ class YouTubeClient:
         Returns:
             Dictionary mapping category IDs to names
         """
+        cached = self._category_cache
+        if cached and time.monotonic() - cached[0] < _CATEGORY_CACHE_TTL:
+            return dict(cached[1])
+        
         try:
-            response = self.youtube.videoCategories().list(
-                part='snippet',
-                regionCode='US'
-            ).execute()
+            response = self._api_get('videoCategories', part='snippet', regionCode='US')
             
             categories = {}
             for item in response.get('items', []):
@@ -530,12 +942,13 @@ class YouTubeClient:
                 categories[category_id] = category_name
             
             logger.info(f"Retrieved {len(categories)} video categories")
-            return categories
+            self._category_cache = (time.monotonic(), categories)
+            return dict(categories)
             
-        except HttpError as e:
+        except requests.RequestException as e:
             logger.error(f"Failed to get video categories: {str(e)}")
             # Return default categories if API call fails
-            return config.VIDEO_CATEGORIES
+            return dict(config.VIDEO_CATEGORIES)
     
     def get_upload_status(self, upload_url: str) -> Dict[str, any]:
         """
@@ -564,16 +977,13 @@ class YouTubeClient:
         """
         try:
             # Try to fetch channel info to test connection
-            response = self.youtube.channels().list(
-                part='snippet',
-                mine=True
-            ).execute()
+            response = self._api_get('channels', part='snippet', mine='true')
             
             channel_title = response['items'][0]['snippet']['title']
             logger.info(f"Connection test successful. Channel: {channel_title}")
             return True
             
-        except HttpError as e:
+        except requests.RequestException as e:
             logger.error(f"Connection test failed: {str(e)}")
             return False
         except Exception as e:
@@ -587,18 +997,19 @@ class YouTubeClient:
         Returns:
             Dictionary with channel information
         """
+        cached = self._channel_cache
+        if cached and time.monotonic() - cached[0] < _CHANNEL_CACHE_TTL:
+            return dict(cached[1])
+        
         try:
-            response = self.youtube.channels().list(
-                part='snippet,statistics',
-                mine=True
-            ).execute()
+            response = self._api_get('channels', part='snippet,statistics', mine='true')
             
             if not response.get('items'):
                 return {}
             
             channel = response['items'][0]
             
-            return {
+            channel_info = {
                 'channel_id': channel['id'],
                 'title': channel['snippet']['title'],
                 'description': channel['snippet'].get('description', ''),
@@ -607,10 +1018,26 @@ class YouTubeClient:
                 'video_count': int(channel['statistics'].get('videoCount', 0)),
                 'view_count': int(channel['statistics'].get('viewCount', 0))
             }
+            self._channel_cache = (time.monotonic(), channel_info)
+            return dict(channel_info)
             
-        except HttpError as e:
+        except requests.RequestException as e:
             logger.error(f"Failed to get channel info: {str(e)}")
             return {}
         except Exception as e:
             logger.error(f"Failed to get channel info: {str(e)}")
             return {}
+    
+    def invalidate_caches(self) -> None:
+        """Drop cached category and channel lookups so the next call refetches them."""
+        self._category_cache = None
+        self._channel_cache = None
+
+
+def _upload_in_process(
+    credentials: Credentials,
+    file_path: str,
+    metadata: Dict[str, any]
+) -> Dict[str, any]:
+    """Upload a single video in a worker process for upload_videos_batch."""
+    return YouTubeClient(credentials).upload_video(file_path, metadata)